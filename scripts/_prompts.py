@@ -0,0 +1,197 @@
+"""Prompt text shared by the consultation scripts.
+
+Kept in one place so the scripts send byte-identical prompts: edits can't
+drift between copies, and response cache keys stay stable across runs.
+"""
+
+import functools
+from pathlib import Path
+
+REQUIREMENTS_PATH = Path(__file__).parent.parent / "docs" / "REQUIREMENTS.md"
+
+V1_1_CONTEXT = """
+# Engram v1.0 — What Exists Today
+
+Engram is a local-first project memory system for AI coding agents. It's a "project memory log with a briefing interface" — NOT a message bus.
+
+## Current Architecture
+- **Language**: Python 3.12+, single dependency (click for CLI)
+- **Storage**: SQLite with WAL mode, FTS5 full-text search
+- **Schema**: 6 fields only (id, timestamp, event_type, agent_id, content, scope)
+- **Event types**: discovery, decision, warning, mutation, outcome
+- **Content cap**: 2000 characters per event
+- **Interfaces**: CLI (click) + MCP server (FastMCP for Claude Code)
+- **Bootstrap**: `engram init` mines git history + README/CLAUDE.md to seed events (solves cold-start)
+- **Briefing**: Summarizes warnings, decisions, mutations, discoveries, outcomes from configurable time window
+- **Query**: FTS5 full-text + structured filters (type, scope, since, agent_id)
+- **Output formats**: Compact single-line (token-efficient) and JSON
+
+## What v1.0 Does Well
+- Zero-config: `engram init` and you have a useful briefing immediately
+- Git bootstrap solves the cold-start problem
+- FTS5 handles queries well at small scale
+- Compact output is genuinely token-efficient
+- MCP integration means Claude Code can use it natively
+
+## What v1.0 Lacks (Known Gaps)
+1. Agents must MANUALLY post events — high activation energy, low compliance
+2. No automatic observation of agent activity
+3. No stale assumption detection
+4. CLAUDE.md snippet is printed but not auto-written
+5. No event priority/importance weighting
+6. No hierarchical summarization (everything is flat)
+7. No way to link events (no references between events)
+8. No garbage collection or archival
+
+## v1.1 Roadmap (From Original Consultation)
+These were identified by GPT-4o, Gemini 2.5 Flash, and Claude Sonnet during v1.0 planning:
+
+1. **Passive Observation** — Auto-generate mutation events from file writes (via MCP tool wrapper or file watcher)
+2. **CLAUDE.md Auto-Generation** — `engram init` writes the agent instruction snippet directly
+3. **Compact Output Improvements** — Even more token-efficient formats
+4. **Stale Assumption Detection** — Flag decisions/assumptions invalidated by subsequent mutations
+"""
+
+# The static context leads so provider prefix caches hit on re-runs;
+# everything after it is the per-consultation ask.
+V1_1_PROMPT_TEMPLATE = """Current state of the project:
+
+---
+{context}
+---
+
+You previously reviewed the requirements for this project (then called "AgentBus") before v1.0 was built. Now v1.0 is complete and working, as summarized above. I need your critique of the v1.1 roadmap and ideas for what the next development phase should include.
+
+I need your critical review on:
+
+1. **The v1.1 features listed above** — Are these the right priorities? What's missing? What should be cut or deferred? Rank them by impact.
+
+2. **The passive observation problem** — This is the hardest and most important feature. How should it work concretely? Options include:
+   - MCP tool wrapper that intercepts file writes and auto-posts mutation events
+   - File system watcher (inotify/fswatch) that detects changes
+   - Git diff on session end that generates events from what changed
+   - Hook into Claude Code's tool use (pre/post hooks)
+   - Something else entirely?
+
+   What's the most practical approach that actually works?
+
+3. **Event linking and references** — Should v1.1 add the ability to link events? (e.g., an outcome event referencing the decision it evaluates) How complex should this be?
+
+4. **Briefing intelligence** — The current briefing is a dumb list of recent events by type. How should it get smarter? Ideas:
+   - Deduplication (similar events collapsed)
+   - Priority scoring (some events matter more)
+   - Staleness detection (old warnings that may no longer apply)
+   - Cross-referencing (decision X was contradicted by mutation Y)
+
+5. **What's the single highest-impact thing we could build for v1.1?** Not a feature list — the ONE thing that would most increase adoption and daily usefulness.
+
+6. **What should we explicitly NOT build yet?** What's tempting but premature?
+
+7. **Any new ideas?** Things nobody has suggested yet that would make this significantly more useful.
+
+Be direct and specific. Concrete implementation suggestions over abstract principles. If you think a feature is wrong-headed, say so.
+"""
+
+
+# AgentBus requirements review: one lens per agent, asked after the
+# requirements document (see load_requirements).
+V1_PROMPTS = {
+    "openai": {
+        "model": "gpt-4o",
+        "system": "You are a senior AI systems architect reviewing a product requirements document. You are also an AI agent yourself — review this from the perspective of a tool YOU would use. Be direct, critical, and specific. No filler.",
+        "user": """I'm designing an open-source project called AgentBus — a local-first, project-scoped inter-agent message bus with persistent semantic memory. The primary users are AI coding agents (Claude Code, GitHub Copilot, Cursor, custom agents) working on the same codebase, often in parallel. The full requirements are above.
+
+I want your critical review as if YOU were an AI agent that would use this system. Specifically:
+
+1. **Event schema critique**: Look at the event types (discovery, decision, warning, mutation, completion, blocker, assumption, question, outcome). What's missing? What's redundant? Would you actually use all of these, or would you collapse some?
+
+2. **API ergonomics**: If you had to post events and query them via HTTP or CLI, what would the ideal interface look like? What would make you NOT want to use it (too verbose, too many required fields, etc.)?
+
+3. **The cold start problem**: When you connect to a project with 500+ events, how should the briefing work? What's the right balance between completeness and token efficiency?
+
+4. **Cross-agent coordination without MCP**: Not all agents use MCP. How should AgentBus work for agents that can only run CLI commands or make HTTP calls? What's the minimum viable integration?
+
+5. **What would you actually use?**: Be honest — which features would you use every session, which occasionally, and which would you ignore? What's the MVP that would make you adopt this?
+
+6. **Failure modes**: What happens when an agent crashes without disconnecting? When events pile up faster than they're read? When two agents post contradictory decisions simultaneously?
+
+7. **What's missing?**: From your perspective as an AI agent working on code, what coordination problem does this NOT solve that you'd want it to?
+
+Be direct and critical. I'd rather hear "this feature is unnecessary" than get false validation."""
+    },
+
+    "gemini": {
+        "model": "gemini-2.5-flash",
+        "system": "You are a senior AI systems architect with deep expertise in large-context LLMs, multi-modal AI, and distributed systems. Review this from the perspective of an AI agent with massive context windows. Challenge assumptions. Be direct.",
+        "user": """I'm building AgentBus — a local-first inter-agent coordination and memory layer for AI coding agents. Think of it as a project-scoped event bus + persistent semantic memory, stored in SQLite with local embeddings.
+
+I specifically want YOUR perspective because Gemini has massive context windows (1M+ tokens). This challenges some core assumptions in this design. The full requirements are above.
+
+My critical questions for you:
+
+1. **Does persistent memory even matter with large context?** With 1M+ token context, you could theoretically ingest the entire event log raw. Is the semantic search / embedding layer overengineered? Or is structured retrieval still valuable even with huge context windows? Where's the crossover point?
+
+2. **Multi-modal events**: Should events support images/screenshots? An agent might want to record "this is what the UI looked like when I found the bug" with a screenshot. Would you use this? How should it be stored and queried?
+
+3. **Event granularity**: 9 event types defined. Is this too fine-grained? Too coarse? Would you prefer fewer types with richer metadata, or more types with clearer semantics?
+
+4. **The briefing problem at scale**: With 10,000+ events, generating a briefing requires summarization. Should the bus maintain a running summary that updates incrementally, or regenerate from scratch? What about hierarchical summaries (daily → weekly → project-level)?
+
+5. **Embedding model choice**: Planning local embeddings (all-MiniLM-L6-v2, 384 dimensions). For a system where queries are mostly about code, architecture, and technical decisions — is this the right model? Should we use a code-specific embedding model instead?
+
+6. **Token-efficient event format**: If an agent needs to consume 50 events as context, what's the most token-efficient serialization? JSON is verbose. Should we have a compact format for bulk retrieval?
+
+7. **Conflict detection nuance**: Two agents editing the same file isn't always a conflict — they might be editing different functions. Should conflict detection be AST-aware or line-range-aware rather than file-level?
+
+8. **What would make this transformative vs. merely useful?** What's the one feature or design choice that would make you actually change how you work?
+
+Think from first principles. Challenge my assumptions."""
+    },
+
+    "claude": {
+        "model": "claude-sonnet-4-20250514",
+        "system": "You are reviewing a requirements document written by another Claude instance. Your job is to be a CRITIC, not a collaborator. Pretend you didn't write this. Find the weaknesses, the over-engineering, the adoption barriers. Be brutally honest.",
+        "user": """Above is a requirements document for a project called AgentBus — an inter-agent message bus with persistent memory for AI coding agents. Another Claude instance designed this. I need you to tear it apart constructively.
+
+Review with these lenses:
+
+1. **Would you actually use this?** Be brutally honest. During a typical Claude Code session where you're fixing bugs or adding features, would you actually stop to post events? What's the activation energy problem?
+
+2. **Complexity budget**: This spec has 7 major components. If you could only build 3, which 3 actually matter? What's the true MVP?
+
+3. **The adoption problem**: AI agents don't choose their tools — humans configure them. How do you convince a developer to add AgentBus to their workflow? What's the "install and immediately see value" experience?
+
+4. **Schema over-engineering**: The event schema has 12+ fields. Which fields would you actually populate consistently? Which would you leave empty 90% of the time?
+
+5. **Semantic search skepticism**: Is embedding-based search actually necessary for < 10k events, or would full-text search + structured filters cover 95% of real queries?
+
+6. **Missing: the "automatic" angle**: The spec requires agents to explicitly post events. What if the bus could OBSERVE agent activity (file reads, writes, tool calls) and generate events automatically? Is that more realistic than expecting agents to self-report?
+
+7. **Naming and framing**: Is "AgentBus" the right name? Does "bus" set the wrong expectation (enterprise middleware)? Would "AgentMemory" or "AgentLog" be more accurate?
+
+8. **What's the one thing that kills this project?** Every project has a fatal flaw. What's this one's?
+
+Don't hedge. Give me your actual opinion."""
+    }
+}
+
+
+V1_1_PROMPTS = {
+    "openai": {
+        "model": "gpt-4o",
+        "system": "You are a senior AI systems architect. You are also an AI coding agent yourself — you use tools like this daily. Review from the perspective of a tool YOU would want to use. Be direct, critical, and specific.",
+    },
+    "gemini": {
+        "model": "gemini-2.5-flash",
+        "system": "You are a senior AI systems architect with expertise in large-context LLMs and developer tooling. You previously reviewed this project and advocated for semantic search and hierarchical summarization. Now review the v1.1 plan with fresh eyes. Be direct and critical.",
+    },
+}
+
+
+@functools.cache
+def load_requirements() -> str:
+    """Return the AgentBus requirements document, or "" if it is missing.
+
+    Read at most once per process, and only when a prompt needs it.
+    """
+    return REQUIREMENTS_PATH.read_text() if REQUIREMENTS_PATH.exists() else ""
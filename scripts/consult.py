@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Consult external AI agents and save their reviews to docs/consultations/.
+
+    python scripts/consult.py v1 [openai|gemini|claude|all]...
+    python scripts/consult.py v1.1 [openai|gemini|all]...
+
+`v1` is the original AgentBus requirements review; `v1.1` is the Engram v1.1
+roadmap review. Both share one driver: providers are called concurrently,
+responses stream straight to disk, transient failures are retried, and
+unchanged prompts are replayed from an on-disk cache.
+
+Optional: `pip install 'httpx[http2]'` lets the Claude client multiplex
+requests over a single HTTP/2 connection, and `orjson` speeds up encoding
+the Claude request body and decoding its event stream. Gemini goes through the
+google-genai SDK; set GEMINI_LEGACY_SDK=1 to use google-generativeai instead.
+"""
+
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+import functools
+from pathlib import Path
+from datetime import datetime
+
+import click
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+from _prompts import (
+    REQUIREMENTS_PATH, V1_PROMPTS, V1_1_PROMPTS, V1_1_CONTEXT, V1_1_PROMPT_TEMPLATE,
+    load_requirements,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONSULT_DIR = PROJECT_ROOT / "docs" / "consultations"
+CACHE_DIR = CONSULT_DIR / ".cache"
+
+
+@functools.cache
+def build_v1_prompt(agent_name: str) -> dict:
+    """An AgentBus review prompt: the requirements doc, then the agent's lens."""
+    # Sent verbatim as the first block of every user message. Providers cache
+    # on a shared static prefix, so the large requirements doc must lead and
+    # the agent-specific questions must trail it.
+    requirements_block = f"""Full requirements for AgentBus:
+
+---
+{load_requirements()}
+---"""
+    return {**V1_PROMPTS[agent_name], "requirements": requirements_block}
+
+
+@functools.cache
+def build_v1_1_prompt(agent_name: str) -> dict:
+    """An Engram v1.1 roadmap prompt; the context is already in the template."""
+    prompt = {
+        **V1_1_PROMPTS[agent_name],
+        "requirements": "",
+        "user": V1_1_PROMPT_TEMPLATE.format(context=V1_1_CONTEXT),
+    }
+    if agent_name == "gemini":
+        prompt["max_tokens"] = 8192
+    return prompt
+
+
+def _user_text(prompt: dict) -> str:
+    """The full user message: static requirements (if any) first, then the ask."""
+    return "\n\n".join(part for part in (prompt["requirements"], prompt["user"]) if part)
+
+
+# Status codes worth retrying: rate limits, transient 5xx, Anthropic overload.
+RETRY_STATUSES = {429, 500, 502, 503, 529}
+MAX_ATTEMPTS = 6
+
+
+class RetryableError(Exception):
+    """A transient provider failure (rate limit, overload, timeout)."""
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after(value) -> float | None:
+    """Parse a retry-after header given in seconds; ignore anything else."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+async def with_retries(call_fn, api_key: str, prompt: dict):
+    """Re-issue a call with exponential backoff and jitter on transient errors.
+
+    Only failures before the first streamed chunk are retried — once output
+    has reached the file, restarting would duplicate it.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        started = False
+        try:
+            async for text in call_fn(api_key, prompt):
+                started = True
+                yield text
+            return
+        except RetryableError as e:
+            if started or attempt == MAX_ATTEMPTS:
+                raise
+            delay = e.retry_after or min(60.0, 2.0 * 2 ** (attempt - 1)) + random.uniform(0, 1)
+            print(f"  {prompt['model']}: {e} — retrying in {delay:.0f}s "
+                  f"(attempt {attempt + 1}/{MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
+
+
+# Max in-flight requests per provider, so batch runs stay under each
+# provider's requests-per-minute limits.
+PROVIDER_CONCURRENCY = {"openai": 5, "gemini": 10, "claude": 3}
+_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+
+
+def rate_limited(provider: str):
+    """Hold one of the provider's concurrency slots for the whole stream."""
+    def decorator(call_fn):
+        @functools.wraps(call_fn)
+        async def wrapper(api_key: str, prompt: dict):
+            sem = _SEMAPHORES.get(provider)
+            if sem is None:
+                sem = _SEMAPHORES[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+            async with sem:
+                async for text in call_fn(api_key, prompt):
+                    yield text
+        return wrapper
+    return decorator
+
+
+@rate_limited("openai")
+async def call_openai(api_key: str, prompt: dict):
+    """Stream the OpenAI response to the consultation prompt."""
+    import openai
+    client = openai.AsyncOpenAI(api_key=api_key)
+
+    print(f"  Calling OpenAI ({prompt['model']})...")
+
+    try:
+        stream = await client.chat.completions.create(
+            model=prompt["model"],
+            messages=[
+                {"role": "system", "content": prompt["system"]},
+                {"role": "user", "content": _user_text(prompt)}
+            ],
+            temperature=prompt["temperature"],
+            max_tokens=prompt.get("max_tokens", 4096),
+            stream=True
+        )
+    except (openai.RateLimitError, openai.APITimeoutError,
+            openai.APIConnectionError, openai.InternalServerError) as e:
+        response = getattr(e, "response", None)
+        retry_after = _retry_after(response.headers.get("retry-after")) if response else None
+        raise RetryableError(f"OpenAI: {e}", retry_after) from e
+
+    async for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+
+@rate_limited("gemini")
+async def call_gemini(api_key: str, prompt: dict):
+    """Stream the Google Gemini response to the consultation prompt."""
+    print(f"  Calling Gemini ({prompt['model']})...")
+
+    if os.environ.get("GEMINI_LEGACY_SDK"):
+        async for text in _call_gemini_legacy(api_key, prompt):
+            yield text
+        return
+
+    from google import genai
+    from google.genai import errors as gerrors
+    client = genai.Client(api_key=api_key)
+
+    try:
+        stream = await client.aio.models.generate_content_stream(
+            model=prompt["model"],
+            contents=[prompt["requirements"], prompt["user"]] if prompt["requirements"] else prompt["user"],
+            config={
+                "system_instruction": prompt["system"],
+                "temperature": prompt["temperature"],
+                "max_output_tokens": prompt.get("max_tokens", 4096),
+            },
+        )
+    except gerrors.APIError as e:
+        if e.code in RETRY_STATUSES:
+            raise RetryableError(f"Gemini: {e}") from e
+        raise
+
+    async for chunk in stream:
+        yield chunk.text or ""
+
+
+async def _call_gemini_legacy(api_key: str, prompt: dict):
+    """Gemini via the older google-generativeai SDK."""
+    import google.generativeai as genai
+    from google.api_core import exceptions as gexc
+    genai.configure(api_key=api_key)
+
+    model = genai.GenerativeModel(
+        model_name=prompt["model"],
+        system_instruction=prompt["system"]
+    )
+    transient = (gexc.ResourceExhausted, gexc.ServiceUnavailable,
+                 gexc.DeadlineExceeded, gexc.InternalServerError)
+
+    # The legacy SDK has no async client; run the blocking call and each
+    # blocking chunk fetch in a thread so it overlaps with the other providers.
+    try:
+        response = await asyncio.to_thread(
+            model.generate_content,
+            [part for part in (prompt["requirements"], prompt["user"]) if part],
+            generation_config=genai.GenerationConfig(
+                temperature=prompt["temperature"],
+                max_output_tokens=prompt.get("max_tokens", 4096)
+            ),
+            stream=True
+        )
+        chunks = iter(response)
+        first = await asyncio.to_thread(next, chunks, None)
+    except transient as e:
+        raise RetryableError(f"Gemini: {e}") from e
+
+    chunk = first
+    while chunk is not None:
+        yield chunk.text
+        chunk = await asyncio.to_thread(next, chunks, None)
+
+
+_ANTHROPIC_CLIENT = None
+
+
+def _anthropic_client():
+    """Shared pooled client so repeated Claude calls reuse one TLS connection.
+
+    HTTP/2 multiplexing is enabled when the optional `h2` package is present
+    (`pip install 'httpx[http2]'`); otherwise the pool falls back to HTTP/1.1
+    keep-alive.
+    """
+    global _ANTHROPIC_CLIENT
+    if _ANTHROPIC_CLIENT is None:
+        import importlib.util
+        import httpx
+        _ANTHROPIC_CLIENT = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=120.0,
+            headers={
+                "anthropic-version": "2023-06-01",
+                "content-type": "application/json",
+            },
+        )
+    return _ANTHROPIC_CLIENT
+
+
+@rate_limited("claude")
+async def call_claude(api_key: str, prompt: dict):
+    """Stream the Anthropic Claude response to the consultation prompt."""
+    print(f"  Calling Claude ({prompt['model']})...")
+
+    import httpx
+
+    content = [{"type": "text", "text": prompt["user"]}]
+    if prompt["requirements"]:
+        content.insert(0, {"type": "text", "text": prompt["requirements"],
+                           "cache_control": {"type": "ephemeral"}})
+    # Pre-encoded bytes: httpx would otherwise run stdlib json.dumps itself.
+    body = _json_dumps({
+        "model": prompt["model"],
+        "max_tokens": prompt.get("max_tokens", 4096),
+        "temperature": prompt["temperature"],
+        "stream": True,
+        "system": prompt["system"],
+        "messages": [{"role": "user", "content": content}]
+    })
+
+    try:
+        async with _anthropic_client().stream(
+            "POST",
+            "https://api.anthropic.com/v1/messages",
+            headers={"x-api-key": api_key},
+            content=body,
+        ) as response:
+            if response.status_code in RETRY_STATUSES:
+                raise RetryableError(
+                    f"Claude: HTTP {response.status_code}",
+                    _retry_after(response.headers.get("retry-after")),
+                )
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            # Server-sent events: only text deltas carry response content.
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = _json_loads(line[len("data: "):])
+                if event.get("type") == "content_block_delta":
+                    yield event["delta"].get("text", "")
+                elif event.get("type") == "error":
+                    error = event.get("error", {})
+                    if error.get("type") == "overloaded_error":
+                        raise RetryableError(f"Claude: {error.get('message', 'overloaded')}")
+                    raise RuntimeError(f"Claude: {error.get('message', error)}")
+    except (httpx.TimeoutException, httpx.ConnectError) as e:
+        raise RetryableError(f"Claude: {e!r}") from e
+
+
+CALLERS = {
+    "openai": call_openai,
+    "gemini": call_gemini,
+    "claude": call_claude,
+}
+
+
+def _cache_path(prompt: dict) -> Path:
+    """Cache file for a prompt, keyed on everything that shapes the response."""
+    key = hashlib.sha256(json.dumps({
+        "m": prompt["model"],
+        "s": prompt["system"],
+        "u": _user_text(prompt),
+        "t": prompt["temperature"],
+    }, sort_keys=True).encode()).hexdigest()
+    return CACHE_DIR / f"{key}.txt"
+
+
+async def cached_call(call_fn, api_key: str, prompt: dict,
+                      use_cache: bool = True, ttl: float | None = None):
+    """Replay a cached response for an unchanged prompt, else stream and store it.
+
+    `ttl` is in seconds; None keeps cache entries forever. With
+    `use_cache=False` the provider is always called but the cache is refreshed.
+    """
+    path = _cache_path(prompt)
+    if use_cache and path.exists():
+        if ttl is None or time.time() - path.stat().st_mtime < ttl:
+            print(f"  Cache hit ({prompt['model']}): {path.name[:12]}")
+            yield path.read_text()
+            return
+
+    parts = []
+    async for text in with_retries(call_fn, api_key, prompt):
+        parts.append(text)
+        yield text
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("".join(parts))
+    tmp.replace(path)
+
+
+# Lens order for --consolidate-lenses: each agent's question set, asked of
+# a single provider in one request so the requirements are billed once.
+LENSES = [
+    ("A", "systems architect", "openai"),
+    ("B", "large-context", "gemini"),
+    ("C", "critic", "claude"),
+]
+
+
+def build_consolidated_prompt(agent_name: str) -> dict:
+    """One prompt carrying every lens's questions under labeled headers."""
+    sections = "\n\n".join(
+        f"## LENS {label} ({desc})\n{V1_PROMPTS[lens]['user']}"
+        for label, desc, lens in LENSES
+    )
+    headers = ", ".join(f"'### LENS {label}'" for label, _, _ in LENSES)
+    user = f"{sections}\n\nRespond with three sections headed {headers}."
+    return {**build_v1_prompt(agent_name), "user": user}
+
+
+def split_lenses(text: str) -> dict[str, str]:
+    """Split a consolidated response into {label: section} on its LENS headers."""
+    parts = re.split(r"^#+\s*LENS ([A-Z])\b.*$", text, flags=re.MULTILINE)
+    return {label: body.strip() for label, body in zip(parts[1::2], parts[2::2])}
+
+
+async def _single(text: str):
+    yield text
+
+
+async def save_response(name: str, chunks, model: str, title: str) -> Path:
+    """Stream a consultation response to docs/consultations/ as it arrives."""
+    CONSULT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # One clock read, so the filename and header timestamps always agree.
+    now = datetime.now()
+    filename = f"{name}-{now.strftime('%Y%m%d-%H%M%S')}.md"
+    filepath = CONSULT_DIR / filename
+
+    agent = name.split("-", 1)[0]
+    header = f"# {title}: {agent.upper()}\n"
+    header += f"Date: {now.isoformat()}\n"
+    header += f"Model: {model}\n\n---\n\n"
+
+    # Stream into a temp file and rename on completion, so an interrupted
+    # run never leaves a truncated consultation behind.
+    tmp = filepath.with_suffix(".md.tmp")
+    try:
+        with tmp.open("w") as f:
+            f.write(header)
+            async for text in chunks:
+                f.write(text)
+                f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(filepath)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    print(f"  Saved: {filepath}")
+    return filepath
+
+
+async def consult_lenses(agent_name: str, chunks, model: str, title: str) -> list[Path]:
+    """Save each lens of a consolidated response to its own file."""
+    text = "".join([t async for t in chunks])
+    sections = split_lenses(text)
+    if not sections:
+        # Model ignored the headers; keep the response rather than drop it.
+        return [await save_response(agent_name, _single(text), model, title)]
+    return [
+        await save_response(f"{agent_name}-lens-{lens}", _single(sections[label]), model, title)
+        for label, _, lens in LENSES
+        if label in sections
+    ]
+
+
+async def run(jobs: list[tuple], title: str, save_fn=save_response, *,
+              concurrent: bool = True, use_cache: bool = True,
+              ttl: float | None = None) -> tuple[dict, dict]:
+    """Consult each (name, agent, api_key, prompt) job; return (results, errors)."""
+    async def consult(name, agent, api_key, prompt):
+        chunks = cached_call(CALLERS[agent], api_key, prompt, use_cache=use_cache, ttl=ttl)
+        return await save_fn(name, chunks, prompt["model"], title)
+
+    try:
+        if concurrent:
+            # Wall time is the slowest call, not the sum. return_exceptions
+            # keeps one failing provider from cancelling the rest.
+            outcomes = await asyncio.gather(
+                *(consult(*job) for job in jobs), return_exceptions=True
+            )
+        else:
+            outcomes = []
+            for job in jobs:
+                try:
+                    outcomes.append(await consult(*job))
+                except Exception as e:
+                    outcomes.append(e)
+    finally:
+        if _ANTHROPIC_CLIENT is not None:
+            await _ANTHROPIC_CLIENT.aclose()
+
+    results = {}
+    errors = {}
+    for (name, *_), outcome in zip(jobs, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  [{name}] ERROR: {outcome}")
+            errors[name] = str(outcome)
+            continue
+        paths = outcome if isinstance(outcome, list) else [outcome]
+        results[name] = ", ".join(str(p) for p in paths)
+        print(f"  [{name}] Done.")
+    return results, errors
+
+
+KEY_ENVVARS = {
+    "openai": ["OPENAI_API_KEY"],
+    "gemini": ["GOOGLE_API_KEY", "GEMINI_API_KEY"],
+    "claude": ["ANTHROPIC_API_KEY"],
+}
+
+
+def _collect_jobs(agents, available, keys, build, suffix, temperature) -> list[tuple]:
+    targets = list(available) if not agents or "all" in agents else agents
+    jobs = []
+    for agent in targets:
+        if agent not in available:
+            click.echo(f"Unknown agent: {agent}. Options: {', '.join(available)}")
+            continue
+        if not keys.get(agent):
+            click.echo(f"\n[SKIP] {agent}: No API key. Set {KEY_ENVVARS[agent][0]} or pass --{agent}-key")
+            continue
+        click.echo(f"\n[{agent.upper()}] Consulting...")
+        prompt = {**build(agent), "temperature": temperature}
+        jobs.append((f"{agent}{suffix}", agent, keys[agent], prompt))
+    return jobs
+
+
+def _summarize(results: dict, errors: dict) -> int:
+    click.echo("\n" + "=" * 60)
+    click.echo("CONSULTATION SUMMARY")
+    click.echo("=" * 60)
+    for name, path in results.items():
+        click.echo(f"  {name}: {path}")
+    for name, err in errors.items():
+        click.echo(f"  {name}: FAILED — {err}")
+
+    if not results:
+        click.echo("\n  No consultations completed. Provide API keys:")
+        click.echo("    --openai-key=sk-...")
+        click.echo("    --gemini-key=AI...")
+        click.echo("    --claude-key=sk-ant-...")
+        click.echo("  Or set environment variables: OPENAI_API_KEY, GOOGLE_API_KEY, ANTHROPIC_API_KEY")
+        return 1
+    return 0
+
+
+def driver_options(f):
+    """Options shared by every consultation command."""
+    options = [
+        click.argument("agents", nargs=-1),
+        click.option("--openai-key", envvar=KEY_ENVVARS["openai"], help="OpenAI API key (or set OPENAI_API_KEY)"),
+        click.option("--gemini-key", envvar=KEY_ENVVARS["gemini"], help="Google API key (or set GOOGLE_API_KEY)"),
+        click.option("--claude-key", envvar=KEY_ENVVARS["claude"], help="Anthropic API key (or set ANTHROPIC_API_KEY)"),
+        click.option("--temperature", type=float, default=0.0, show_default=True,
+                     help="Sampling temperature (0 keeps reruns cacheable)"),
+        click.option("--no-cache", is_flag=True, help="Always call the providers, ignoring cached responses"),
+        click.option("--cache-ttl", type=float, default=None,
+                     help="Ignore cached responses older than this many seconds"),
+        click.option("--concurrent/--sequential", default=True, show_default=True,
+                     help="Call providers in parallel or one at a time"),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+@click.group()
+def cli():
+    """Consult external AI agents; responses land in docs/consultations/."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(PROJECT_ROOT / ".env")
+
+
+@cli.command("v1")
+@driver_options
+@click.option("--consolidate-lenses", is_flag=True,
+              help="With a single provider, ask all three lenses in one request")
+def consult_v1(agents, openai_key, gemini_key, claude_key, temperature,
+               no_cache, cache_ttl, concurrent, consolidate_lenses):
+    """AgentBus requirements review (openai, gemini, claude)."""
+    if not load_requirements().strip():
+        click.echo(f"ERROR: {REQUIREMENTS_PATH} is missing or empty; refusing to consult.")
+        raise SystemExit(2)
+
+    keys = {"openai": openai_key, "gemini": gemini_key, "claude": claude_key}
+    jobs = _collect_jobs(agents, V1_PROMPTS, keys, build_v1_prompt, "", temperature)
+
+    save_fn = save_response
+    if consolidate_lenses and len(jobs) == 1:
+        name, agent, api_key, _ = jobs[0]
+        prompt = {**build_consolidated_prompt(agent), "temperature": temperature}
+        jobs = [(name, agent, api_key, prompt)]
+        save_fn = consult_lenses
+    elif consolidate_lenses:
+        click.echo("\n[NOTE] --consolidate-lenses needs exactly one provider; ignoring")
+
+    results, errors = asyncio.run(run(
+        jobs, "AgentBus Consultation", save_fn,
+        concurrent=concurrent, use_cache=not no_cache, ttl=cache_ttl,
+    ))
+    raise SystemExit(_summarize(results, errors))
+
+
+@cli.command("v1.1")
+@driver_options
+def consult_v1_1(agents, openai_key, gemini_key, claude_key, temperature,
+                 no_cache, cache_ttl, concurrent):
+    """Engram v1.1 roadmap review (openai, gemini)."""
+    keys = {"openai": openai_key, "gemini": gemini_key}
+    jobs = _collect_jobs(agents, V1_1_PROMPTS, keys, build_v1_1_prompt, "-v1.1", temperature)
+    results, errors = asyncio.run(run(
+        jobs, "Engram v1.1 Consultation",
+        concurrent=concurrent, use_cache=not no_cache, ttl=cache_ttl,
+    ))
+    raise SystemExit(_summarize(results, errors))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,54 @@
+"""JSON for the hook and CLI hot paths: orjson when installed, stdlib otherwise.
+
+dumps_pretty/write_pretty accept dataclasses (events, sessions, briefings)
+and str enums directly; both backends emit their fields and values.
+"""
+
+import dataclasses
+
+try:
+    import orjson
+except ImportError:  # optional: pip install 'engram[speedups]'
+    orjson = None
+
+# loads(bytes | str) is bound straight to the parser: it runs once per
+# hook fire, so it skips a wrapper call.
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_pretty(obj) -> str:
+        """Serialize with 2-space indentation."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def write_pretty(obj, out) -> None:
+        """Write indented JSON and a newline to a text stream.
+
+        orjson's bytes go straight to the stream's binary buffer when it has
+        one, skipping a decode and the text layer's re-encode.
+        """
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        buffer = getattr(out, "buffer", None)
+        if buffer is None:
+            out.write(data.decode())
+        else:
+            out.flush()  # keep earlier text output ahead of the bytes
+            buffer.write(data)
+else:
+    import json
+
+    loads = json.loads
+
+    def _default(obj):
+        # Enum members need nothing: EventType is a str, emitted as its value
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps_pretty(obj) -> str:
+        """Serialize with 2-space indentation."""
+        return json.dumps(obj, indent=2, default=_default)
+
+    def write_pretty(obj, out) -> None:
+        """Write indented JSON and a newline to a text stream."""
+        json.dump(obj, out, indent=2, default=_default)
+        out.write("\n")
@@ -1,20 +1,40 @@
 """Git history mining and seed event generation."""
 
+import itertools
 import re
 import subprocess
+import tomllib
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from engram.models import Event, EventType
+from engram.validation import truncate_content
 
-FIX_PATTERN = re.compile(r"\b(fix|bug|patch|resolve|hotfix|repair)\b", re.IGNORECASE)
-REFACTOR_PATTERN = re.compile(
-    r"\b(refactor|restructure|migrate|rewrite|redesign|overhaul|reorganize)\b",
+try:
+    import pygit2
+except ImportError:  # optional: falls back to the git CLI
+    pygit2 = None
+
+# One pass over each subject: fix keywords and refactor keywords as named
+# alternatives of a single pattern.
+CLASSIFY_PATTERN = re.compile(
+    r"\b(?:(?P<fix>fix|bug|patch|resolve|hotfix|repair)"
+    r"|(?P<refactor>refactor|restructure|migrate|rewrite|redesign|overhaul|reorganize))\b",
     re.IGNORECASE,
 )
 
-# Null byte as delimiter to handle | in commit subjects
-GIT_LOG_FORMAT = "%H%x00%aI%x00%an%x00%s"
+# Null byte as delimiter to handle | in commit subjects. Each record starts
+# with an ASCII record separator so the stream can be split without relying
+# on blank lines; with -z the file list after the header is NUL-separated.
+RECORD_START = "\x1e"
+GIT_LOG_FORMAT = "%x1e%H%x00%aI%x00%an%x00%s"
 SEPARATOR = "\x00"
+READ_CHUNK = 64 * 1024
+
+# README/CLAUDE.md excerpt length; leaves room for the prefix under the
+# 2000-char content cap
+DOC_EXCERPT_CHARS = 1800
 
 
 class GitBootstrapper:
@@ -24,11 +44,24 @@ class GitBootstrapper:
         self.project_dir = project_dir
         if not (project_dir / ".git").exists():
             raise ValueError(f"Not a git repository: {project_dir}")
+        # With pygit2 installed, history is read straight from the object
+        # database instead of forking git and parsing its text output.
+        self._repo = None
+        if pygit2 is not None:
+            try:
+                self._repo = pygit2.Repository(str(project_dir))
+            except pygit2.GitError:
+                pass
 
-    def mine_history(self, max_commits: int = 100) -> list[Event]:
-        """Parse git log and project docs into seed events."""
-        events = []
-        events.extend(self._parse_commits(max_commits))
+    def mine_history(self, max_commits: int = 100,
+                     paths: list[str] | None = None) -> list[Event]:
+        """Parse git log and project docs into seed events.
+
+        `paths` restricts mining to commits touching those paths, like
+        `git log -- <path>...`: git filters history itself instead of every
+        commit being returned and classified here.
+        """
+        events = list(self._iter_commits(max_commits, paths))
         events.extend(self._extract_project_docs())
         return events
 
@@ -44,56 +77,128 @@ class GitBootstrapper:
         )
         return result.stdout
 
-    def _parse_commits(self, max_commits: int) -> list[Event]:
+    def _parse_commits(self, max_commits: int,
+                       paths: list[str] | None = None) -> list[Event]:
         """Parse git log into events."""
-        raw = self._run_git(
-            "log", f"--pretty=format:{GIT_LOG_FORMAT}", "--name-only",
-            f"-n{max_commits}",
-        )
+        return list(self._iter_commits(max_commits, paths))
 
-        if not raw.strip():
-            return []
+    def _iter_commits(self, max_commits: int,
+                      paths: list[str] | None = None) -> Iterator[Event]:
+        """Yield commit events newest-first as history is read."""
+        if self._repo is not None:
+            yield from self._walk_commits(max_commits, paths)
+            return
 
-        events = []
-        # Split by double newline (separates commits with their file lists)
-        blocks = raw.strip().split("\n\n")
+        pathspec = ["--", *paths] if paths else []
 
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if not lines:
-                continue
+        # Streamed rather than captured: memory stays at one read chunk plus
+        # the record in progress, however long the log is. The file list is
+        # needed for every commit's scope, but rename detection isn't:
+        # --no-renames skips the similarity search and lists a rename as its
+        # old and new paths, as the pygit2 walk does.
+        with subprocess.Popen(
+            ["git", "log", "-z", f"--pretty=format:{GIT_LOG_FORMAT}",
+             "--name-only", "--no-renames", f"-n{max_commits}", *pathspec],
+            cwd=self.project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        ) as proc:
+            pending = ""
+            while chunk := proc.stdout.read(READ_CHUNK):
+                *records, pending = (pending + chunk).split(RECORD_START)
+                for record in records:
+                    if event := self._record_event(record):
+                        yield event
+            if event := self._record_event(pending):
+                yield event
 
-            # First line is the formatted commit info
-            parts = lines[0].split(SEPARATOR)
-            if len(parts) < 4:
-                continue
+    def _record_event(self, record: str) -> Event | None:
+        """Turn one `git log -z` record (header, then NUL-separated files) into an event."""
+        # One split: hash, date, author, "subject\nfirst file", other files...
+        # (%s never contains a newline; -z file names are verbatim).
+        fields = record.split(SEPARATOR)
+        if len(fields) < 4:
+            return None
 
-            commit_hash, date, author, subject = parts[0], parts[1], parts[2], parts[3]
+        subject, _, first_file = fields[3].partition("\n")
+        files = [f for f in (first_file, *fields[4:]) if f]
+        return self._commit_event(fields[1], subject, files)
 
-            # Remaining lines are file paths
-            files = [l.strip() for l in lines[1:] if l.strip()]
+    def _walk_commits(self, max_commits: int,
+                      paths: list[str] | None = None) -> Iterator[Event]:
+        """Walk history with pygit2; mirrors `git log --name-only` output.
 
-            event_type, content = self._classify_commit(subject, files)
+        With `paths`, only non-merge commits touching them are kept and their
+        file lists are limited to matching files, as with a git pathspec.
+        """
+        if self._repo.head_is_unborn:
+            return
+        prefixes = [p.strip("/") for p in paths or []]
 
-            scope = files[:10] if files else None
+        def in_paths(path: str) -> bool:
+            return any(path == p or path.startswith(p + "/") for p in prefixes)
 
-            events.append(Event(
-                id="",
-                timestamp=date,
-                event_type=event_type,
-                agent_id="git-bootstrap",
-                content=content[:2000],
-                scope=scope,
-            ))
+        walker = self._repo.walk(
+            self._repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME
+        )
+        if prefixes:
+            commits = self._walk_touching(walker, in_paths)
+        else:
+            commits = ((commit, self._changed_files(commit)) for commit in walker)
+        for commit, files in itertools.islice(commits, max_commits):
+            author = commit.author
+            tz = timezone(timedelta(minutes=author.offset))
+            date = datetime.fromtimestamp(author.time, tz).isoformat()
+            # %s: the first paragraph of the message, folded onto one line
+            subject = " ".join(commit.message.strip().split("\n\n", 1)[0].split())
 
-        return events
+            yield self._commit_event(date, subject, files)
+
+    @staticmethod
+    def _changed_files(commit) -> list[str]:
+        """Files a commit changed, as `git log --name-only` lists them."""
+        # git log shows no file list for merges (no -m); root commits
+        # list every file as added.
+        if len(commit.parents) > 1:
+            return []
+        if commit.parents:
+            diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        return [d.new_file.path for d in diff.deltas]
+
+    def _walk_touching(self, walker, in_paths) -> Iterator[tuple]:
+        """Yield (commit, matching files) for commits that touch the paths."""
+        for commit in walker:
+            files = [f for f in self._changed_files(commit) if in_paths(f)]
+            if files:
+                yield commit, files
+
+    def _commit_event(self, date: str, subject: str, files: list[str]) -> Event:
+        """Build the seed event for one commit."""
+        event_type, content = self._classify_commit(subject, files)
+        return Event(
+            id="",
+            timestamp=date,
+            event_type=event_type,
+            agent_id="git-bootstrap",
+            content=truncate_content(content),
+            scope=files[:10] if files else None,
+        )
 
     def _classify_commit(self, subject: str, files: list[str]) -> tuple[EventType, str]:
         """Classify a commit into an event type and summarized content."""
-        if FIX_PATTERN.search(subject):
-            return EventType.DISCOVERY, f"Fixed: {subject}"
+        refactor = False
+        for match in CLASSIFY_PATTERN.finditer(subject):
+            # A fix keyword wins wherever it appears in the subject
+            if match.lastgroup == "fix":
+                return EventType.DISCOVERY, f"Fixed: {subject}"
+            refactor = True
 
-        if len(files) >= 10 or REFACTOR_PATTERN.search(subject):
+        if len(files) >= 10 or refactor:
             file_note = f" ({len(files)} files)" if len(files) >= 10 else ""
             return EventType.DECISION, f"Refactored: {subject}{file_note}"
 
@@ -105,35 +210,71 @@ class GitBootstrapper:
 
         for filename in ("README.md", "CLAUDE.md"):
             filepath = self.project_dir / filename
-            if filepath.exists():
-                try:
-                    text = filepath.read_text(encoding="utf-8", errors="replace")
-                    # Take first 1800 chars to leave room for prefix
-                    truncated = text[:1800]
-                    if len(text) > 1800:
-                        truncated += "... (truncated)"
-                    events.append(Event(
-                        id="",
-                        timestamp="",
-                        event_type=EventType.DISCOVERY,
-                        agent_id="git-bootstrap",
-                        content=f"Project {filename}: {truncated}",
-                        scope=[filename],
-                        # Low priority: this is a full doc dump that would
-                        # otherwise dominate briefings. Kept (unlike dropping it)
-                        # so non-Claude MCP agents that don't auto-load CLAUDE.md
-                        # still get a project overview, just not front-and-center.
-                        priority="low",
-                    ))
-                except Exception:
-                    pass
+            # Read only the excerpt (plus one char to detect truncation)
+            # rather than the whole file; a missing file is just skipped.
+            try:
+                with filepath.open(encoding="utf-8", errors="replace") as f:
+                    text = f.read(DOC_EXCERPT_CHARS + 1)
+            except OSError:
+                continue
+
+            truncated = text[:DOC_EXCERPT_CHARS]
+            if len(text) > DOC_EXCERPT_CHARS:
+                truncated += "... (truncated)"
+            events.append(Event(
+                id="",
+                timestamp="",
+                event_type=EventType.DISCOVERY,
+                agent_id="git-bootstrap",
+                content=f"Project {filename}: {truncated}",
+                scope=[filename],
+                # Low priority: this is a full doc dump that would
+                # otherwise dominate briefings. Kept (unlike dropping it)
+                # so non-Claude MCP agents that don't auto-load CLAUDE.md
+                # still get a project overview, just not front-and-center.
+                priority="low",
+            ))
 
         return events
 
+    def _config_origin_url(self) -> str | None:
+        """Origin URL read straight from `.git/config` ("" if there is none).
+
+        Returns None when the config can't be answered from that one file —
+        `.git` is a file (worktrees, submodules) or includes other files —
+        so the caller can ask git instead.
+        """
+        config = self.project_dir / ".git" / "config"
+        try:
+            text = config.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+
+        in_origin = False
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith("["):
+                if line.startswith(("[include", "[includeIf")):
+                    return None
+                in_origin = line == '[remote "origin"]'
+            elif in_origin:
+                key, sep, value = line.partition("=")
+                if sep and key.strip().lower() == "url":
+                    return value.strip().strip('"')
+        return ""
+
     def detect_project_name(self) -> str:
         """Detect project name from git remote, config files, or directory name."""
         # Try git remote
-        remote = self._run_git("remote", "get-url", "origin").strip()
+        if self._repo is not None:
+            try:
+                remote = self._repo.remotes["origin"].url or ""
+            except KeyError:
+                remote = ""
+        else:
+            remote = self._config_origin_url()
+            if remote is None:
+                remote = self._run_git("remote", "get-url", "origin").strip()
         if remote:
             # Extract repo name from URL
             name = remote.rstrip("/").split("/")[-1]
@@ -146,12 +287,12 @@ class GitBootstrapper:
         pyproject = self.project_dir / "pyproject.toml"
         if pyproject.exists():
             try:
-                text = pyproject.read_text()
-                for line in text.splitlines():
-                    if line.strip().startswith("name"):
-                        match = re.search(r'"([^"]+)"', line)
-                        if match:
-                            return match.group(1)
+                with pyproject.open("rb") as f:
+                    data = tomllib.load(f)
+                name = (data.get("project", {}).get("name")
+                        or data.get("tool", {}).get("poetry", {}).get("name"))
+                if name:
+                    return name
             except Exception:
                 pass
 
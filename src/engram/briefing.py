@@ -11,6 +11,26 @@ from engram.store import EventStore
 # Priority sort order (lower = more important)
 _PRIORITY_ORDER = {"critical": 0, "high": 1, "normal": 2, "low": 3}
 
+# Max active events fetched per type for a briefing
+_SECTION_LIMITS = {
+    EventType.WARNING: 20,
+    EventType.DECISION: 15,
+    EventType.MUTATION: 20,
+    EventType.DISCOVERY: 10,
+    EventType.OUTCOME: 5,
+}
+
+# Mutations to one file closer together than this collapse into one entry
+_DEDUP_WINDOW_SECONDS = 30 * 60
+
+
+def _naive_epoch(timestamp: str) -> float | None:
+    """Seconds for the wall-clock part of an ISO timestamp (offset ignored)."""
+    try:
+        return datetime.fromisoformat(timestamp[:19]).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
 
 class BriefingGenerator:
     """Generates project briefings from the event store."""
@@ -45,17 +65,14 @@ class BriefingGenerator:
             if active_sess and active_sess.scope:
                 focus = active_sess.scope[0]
 
-        # Fetch active events by type
-        warnings = self.store.recent_by_type(
-            EventType.WARNING, limit=20, since=since_iso, scope=scope, status="active")
-        decisions = self.store.recent_by_type(
-            EventType.DECISION, limit=15, since=since_iso, scope=scope, status="active")
-        mutations = self.store.recent_by_type(
-            EventType.MUTATION, limit=20, since=since_iso, scope=scope, status="active")
-        discoveries = self.store.recent_by_type(
-            EventType.DISCOVERY, limit=10, since=since_iso, scope=scope, status="active")
-        outcomes = self.store.recent_by_type(
-            EventType.OUTCOME, limit=5, since=since_iso, scope=scope, status="active")
+        # Fetch active events by type (one query, per-type limits)
+        by_type = self.store.recent_by_types(
+            _SECTION_LIMITS, since=since_iso, scope=scope, status="active")
+        warnings = by_type[EventType.WARNING]
+        decisions = by_type[EventType.DECISION]
+        mutations = by_type[EventType.MUTATION]
+        discoveries = by_type[EventType.DISCOVERY]
+        outcomes = by_type[EventType.OUTCOME]
 
         # Post-process mutations
         mutations = self._deduplicate_mutations(mutations)
@@ -77,10 +94,11 @@ class BriefingGenerator:
         focus_relevant: list[Event] = []
         focus_ids: set[str] = set()
         if focus:
+            focus_len = len(focus)
             for event in all_active:
                 if event.id in critical_ids:
                     continue
-                relevance = self._scope_relevance(event, focus)
+                relevance = self._scope_relevance(event, focus, focus_len)
                 if relevance == 0 and event.area and event.area == focus:
                     relevance = 3
                 if relevance > 0:
@@ -102,10 +120,8 @@ class BriefingGenerator:
         # Sort critical warnings by priority then recency
         critical_warnings = self._sort_by_priority_recency(critical_warnings)
 
-        project_name = self.store.get_meta("project_name") or "unknown"
-        total = self.store.count()
-
-        last = self.store.last_activity()
+        project_name, total, last = self.store.briefing_stats()
+        project_name = project_name or "unknown"
         first_ts = since_iso[:10] if since_iso else "unknown"
         last_ts = last[:10] if last else "now"
         time_range = f"{first_ts} to {last_ts}"
@@ -130,9 +146,12 @@ class BriefingGenerator:
         return dt.isoformat()
 
     @staticmethod
-    def _scope_relevance(event: Event, focus_path: str) -> int:
+    def _scope_relevance(event: Event, focus_path: str, focus_len: int) -> int:
         """Score how relevant an event's scope is to the focus path.
 
+        `focus_len` is `len(focus_path)`, computed once per briefing by the
+        caller; comparing lengths first leaves one slice compare per scope.
+
         Returns:
             3 = exact scope match
             2 = event scope is parent of focus
@@ -143,21 +162,28 @@ class BriefingGenerator:
             return 0
 
         for s in event.scope:
-            if s == focus_path:
-                return 3
-            if focus_path.startswith(s):
-                return 2  # event scope is parent of focus
-            if s.startswith(focus_path):
+            ls = len(s)
+            if ls == focus_len:
+                if s == focus_path:
+                    return 3
+            elif ls < focus_len:
+                if focus_path[:ls] == s:
+                    return 2  # event scope is parent of focus
+            elif s[:focus_len] == focus_path:
                 return 1  # event scope is child of focus
         return 0
 
     @staticmethod
     def _sort_by_priority_recency(events: list[Event]) -> list[Event]:
         """Sort events by priority (critical first) then recency (newest first)."""
-        # Two stable sorts: first by timestamp descending, then by priority ascending
-        events_sorted = sorted(events, key=lambda e: e.timestamp, reverse=True)
-        events_sorted = sorted(events_sorted, key=lambda e: _PRIORITY_ORDER.get(e.priority, 2))
-        return events_sorted
+        # One pass: negating priority lets a single reversed sort give priority
+        # ascending and timestamp descending (ISO strings sort chronologically).
+        # reverse=True keeps the sort stable for fully tied events.
+        return sorted(
+            events,
+            key=lambda e: (-_PRIORITY_ORDER.get(e.priority, 2), e.timestamp),
+            reverse=True,
+        )
 
     @staticmethod
     def _deduplicate_mutations(mutations: list[Event]) -> list[Event]:
@@ -186,23 +212,22 @@ class BriefingGenerator:
             # Sort chronologically for windowing
             group.sort(key=lambda e: e.timestamp)
 
-            # Split into 30-min windows
+            # Split into 30-min windows. Each timestamp is parsed once (to
+            # naive epoch seconds, matching the [:19] slice); unparseable
+            # ones join the current window.
+            epochs = [_naive_epoch(e.timestamp) for e in group]
             windows: list[list[Event]] = []
             current_window: list[Event] = [group[0]]
+            prev_epoch = epochs[0]
 
-            for event in group[1:]:
-                prev_ts = current_window[-1].timestamp[:19]
-                curr_ts = event.timestamp[:19]
-                try:
-                    prev_dt = datetime.fromisoformat(prev_ts)
-                    curr_dt = datetime.fromisoformat(curr_ts)
-                    if (curr_dt - prev_dt) <= timedelta(minutes=30):
-                        current_window.append(event)
-                    else:
-                        windows.append(current_window)
-                        current_window = [event]
-                except ValueError:
+            for event, curr_epoch in zip(group[1:], epochs[1:]):
+                if (prev_epoch is None or curr_epoch is None
+                        or curr_epoch - prev_epoch <= _DEDUP_WINDOW_SECONDS):
                     current_window.append(event)
+                else:
+                    windows.append(current_window)
+                    current_window = [event]
+                prev_epoch = curr_epoch
 
             windows.append(current_window)
 
@@ -234,19 +259,25 @@ class BriefingGenerator:
     def _detect_stale(decisions_and_warnings: list[Event],
                       mutations: list[Event]) -> list[Event]:
         """Find decisions/warnings whose scope was modified by a later mutation."""
-        stale: list[Event] = []
+        # File path -> timestamp of the latest mutation touching it. An event
+        # is stale iff some path's latest mutation is after it, so one max
+        # per path replaces any pairwise comparison.
+        latest_mutation: dict[str, str] = {}
+        for mutation in mutations:
+            ts = mutation.timestamp
+            for path in mutation.scope or ():
+                if ts > latest_mutation.get(path, ""):
+                    latest_mutation[path] = ts
 
+        stale: list[Event] = []
+        if not latest_mutation:
+            return stale
         for event in decisions_and_warnings:
             if not event.scope:
                 continue
-            event_scopes = set(event.scope)
-
-            for mutation in mutations:
-                if not mutation.scope:
-                    continue
-                if mutation.timestamp <= event.timestamp:
-                    continue
-                if event_scopes & set(mutation.scope):
+            ts = event.timestamp
+            for path in event.scope:
+                if latest_mutation.get(path, "") > ts:
                     stale.append(event)
                     break
 
@@ -24,6 +24,20 @@ ENRICHABLE_SECTIONS = {
 ENGRAM_START = "<!-- engram:start -->"
 ENGRAM_END = "<!-- engram:end -->"
 
+# Any enrichable section: "## <name>" through to the next "## " heading or
+# EOF. Longer names are tried first so "Known Issues / Technical Debt" isn't
+# claimed by "Known Issues".
+_SECTION_RE = re.compile(
+    r"## (" + "|".join(
+        re.escape(name) for name in sorted(ENRICHABLE_SECTIONS, key=len, reverse=True)
+    ) + r").*?(?=\n## |\Z)",
+    re.DOTALL,
+)
+# A previous enrichment block inside a section
+_ENRICHMENT_RE = re.compile(
+    rf"{re.escape(ENGRAM_START)}.*?{re.escape(ENGRAM_END)}\n?", re.DOTALL
+)
+
 
 class CheckpointEngine:
     """Handles context file enrichment and checkpoint recording."""
@@ -136,38 +150,28 @@ class CheckpointEngine:
         """
         content = path.read_text(encoding="utf-8")
         enriched = []
+        # Several sections share an event type; fetch each type at most once
+        events_by_type: dict[EventType, list] = {}
 
-        for section_name, event_type in ENRICHABLE_SECTIONS.items():
-            # Find section in the markdown (## heading to next ## or end of file)
-            pattern = rf"(## {re.escape(section_name)}.*?)(\n## |\Z)"
-            match = re.search(pattern, content, re.DOTALL)
-            if not match:
-                continue
-
-            section_text = match.group(1)
+        def enrich_section(match: re.Match) -> str:
+            section_name = match.group(1)
+            section_text = match.group(0)
+            # Only the first section with a given heading is enriched
+            if section_name in enriched:
+                return section_text
+            event_type = ENRICHABLE_SECTIONS[section_name]
 
             # Get recent active events of this type
-            events = self.store.recent_by_type(event_type, limit=10, status="active")
-            if not events:
-                continue
-
-            # Filter to events not already mentioned in the section
-            new_events = []
-            for event in events:
-                # Check if the event content (or a significant prefix) appears
-                check_text = event.content[:80]
-                if check_text not in section_text:
-                    new_events.append(event)
-
+            events = events_by_type.get(event_type)
+            if events is None:
+                events = events_by_type[event_type] = self.store.recent_by_type(
+                    event_type, limit=10, status="active")
+
+            # Filter to events not already mentioned in the section: a
+            # substring check on the content (or a significant prefix)
+            new_events = [e for e in events if e.content[:80] not in section_text]
             if not new_events:
-                continue
-
-            # Remove previous enrichment block if present
-            cleanup_pattern = (
-                rf"(## {re.escape(section_name)}.*?)"
-                rf"{re.escape(ENGRAM_START)}.*?{re.escape(ENGRAM_END)}\n?"
-            )
-            content = re.sub(cleanup_pattern, r"\1", content, flags=re.DOTALL)
+                return section_text
 
             # Build enrichment block
             lines = [ENGRAM_START]
@@ -177,15 +181,15 @@ class CheckpointEngine:
             lines.append(ENGRAM_END)
             enrichment = "\n".join(lines)
 
-            # Re-find the section after cleanup and insert enrichment at end
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                insert_pos = match.end(1)
-                content = (
-                    content[:insert_pos] + "\n" + enrichment + "\n"
-                    + content[insert_pos:]
-                )
-                enriched.append(section_name)
+            # Drop any previous enrichment block, append the new one at the
+            # end of the section
+            enriched.append(section_name)
+            return _ENRICHMENT_RE.sub("", section_text, count=1) + "\n" + enrichment + "\n"
+
+        # One pass over the file: every section is cleaned and enriched as
+        # the substitution reaches it.
+        content = _SECTION_RE.sub(enrich_section, content)
+        enriched.sort(key=list(ENRICHABLE_SECTIONS).index)
 
         if enriched:
             path.write_text(content, encoding="utf-8")
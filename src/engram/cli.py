@@ -1,24 +1,31 @@
 """Engram CLI — project memory for AI coding agents."""
 
+import functools
+import mmap
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from engram.models import Event, EventType
-from engram.store import EventStore
-from engram.query import QueryEngine, parse_event_types
-from engram.briefing import BriefingGenerator
-from engram.init import perform_init
-from engram.areas import load_area_map, infer_area
-from engram.formatting import (
-    format_compact, format_json,
-    format_briefing_compact, format_briefing_json,
-)
+from engram import __version__
 
+# Engram modules are imported inside the commands that use them, so each
+# invocation (and `--help`) only loads what it needs: the store pulls in
+# sqlite3, bootstrap pulls in pygit2.
+if TYPE_CHECKING:
+    from engram.store import EventStore
 ENGRAM_DIR = ".engram"
 DB_NAME = "events.db"
+_DB_FILES = frozenset({DB_NAME, f"{DB_NAME}-wal", f"{DB_NAME}-shm"})
+
+# Shared option types, built once rather than per option
+_FMT_CHOICE = click.Choice(("compact", "json"))
+_EVENT_TYPE_CHOICE = click.Choice(("discovery", "decision", "warning", "mutation", "outcome"))
+_PRIORITY_CHOICE = click.Choice(("critical", "high", "normal", "low"))
+_CONV_STATUS_CHOICE = click.Choice(("active", "paused", "completed"))
+_EXTRACT_TYPE_CHOICE = click.Choice(("discovery", "decision", "warning"))
 
 CLAUDE_MD_SNIPPET = """
 ## Project Memory (Engram)
@@ -45,41 +52,91 @@ This project uses Engram for persistent memory across agent sessions.
 - Filter: `engram query -t warning --since 7d -s src/auth`
 """.strip()
 
+# Written and searched as bytes: no per-call encoding, and no newline
+# translation, so the section reads the same on every platform.
+_CLAUDE_MD_SNIPPET_BYTES = (CLAUDE_MD_SNIPPET + "\n").encode("utf-8")
+_CLAUDE_MD_APPEND_BYTES = b"\n\n" + _CLAUDE_MD_SNIPPET_BYTES
+_CLAUDE_MD_MARKER = b"## Project Memory (Engram)"
+
 
 def _resolve_project(project: str) -> Path:
     """Resolve project directory."""
-    return Path(project).resolve()
+    # The default: on POSIX getcwd already reports the physical path, with
+    # symlinks resolved, so there is nothing left to resolve.
+    if project == "." and os.name == "posix":
+        return Path.cwd()
+    # Absolute first, so a cached relative path can't outlive a chdir
+    return _resolve_absolute(os.path.abspath(project))
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_absolute(path: str) -> Path:
+    """Resolve symlinks in an absolute path, once per path per process."""
+    return Path(path).resolve()
+
+
+@functools.lru_cache(maxsize=32)
+def _db_path(project: Path) -> Path:
+    """Path of the project's event database."""
+    return project / ENGRAM_DIR / DB_NAME
+
+
+def _file_contains(path: Path, needle: bytes) -> bool:
+    """Search a file's bytes without reading or decoding it into memory."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
 
 
 def _auto_write_claude_md(project: Path) -> str:
     """Auto-write Engram section to CLAUDE.md. Returns status message."""
     claude_md = project / "CLAUDE.md"
-    marker = "## Project Memory (Engram)"
-
-    if claude_md.exists():
-        content = claude_md.read_text(encoding="utf-8")
-        if marker in content:
-            return "CLAUDE.md already has Engram section."
-        with claude_md.open("a", encoding="utf-8") as f:
-            f.write("\n\n" + CLAUDE_MD_SNIPPET + "\n")
-        return "Appended Engram section to CLAUDE.md."
-    else:
-        claude_md.write_text(CLAUDE_MD_SNIPPET + "\n", encoding="utf-8")
+
+    # Opening the file is the existence check: no separate stat
+    try:
+        has_section = _file_contains(claude_md, _CLAUDE_MD_MARKER)
+    except FileNotFoundError:
+        claude_md.write_bytes(_CLAUDE_MD_SNIPPET_BYTES)
         return "Created CLAUDE.md with Engram section."
 
+    if has_section:
+        return "CLAUDE.md already has Engram section."
+    with claude_md.open("ab") as f:
+        f.write(_CLAUDE_MD_APPEND_BYTES)
+    return "Appended Engram section to CLAUDE.md."
 
-def _get_store(project: Path) -> EventStore:
-    """Get an initialized EventStore for the project."""
-    db_path = project / ENGRAM_DIR / DB_NAME
-    if not db_path.exists():
+
+def _get_store(project: Path) -> "EventStore":
+    """Get an initialized EventStore for the project.
+
+    One store (and connection) per invocation: it is kept on the click
+    context and closed when the root context closes, so commands never
+    close it themselves — including on error exits.
+    """
+    from engram.store import EventStore
+
+    db_path = _db_path(project)
+    ctx = click.get_current_context()
+    ctx.ensure_object(dict)
+    store = ctx.obj.get("store")
+    if store is not None and store.db_path == db_path:
+        return store
+    store = EventStore(db_path, must_exist=True, checkpoint_on_close=False)
+    try:
+        store.conn  # connect now: fails here if the database is missing
+    except FileNotFoundError:
         click.echo(f"Error: Engram not initialized in {project}", err=True)
         click.echo("Run 'engram init' first.", err=True)
         sys.exit(1)
-    store = EventStore(db_path)
+    ctx.obj["store"] = store
+    ctx.find_root().call_on_close(store.close)
     return store
 
 
 @click.group()
+@click.version_option(__version__, "--version", "-V", prog_name="engram")
 @click.option("--project", "-p", default=".", help="Project directory")
 @click.pass_context
 def cli(ctx, project):
@@ -90,14 +147,17 @@ def cli(ctx, project):
 
 @cli.command()
 @click.option("--max-commits", default=100, help="Max git commits to mine")
+@click.option("--path", "paths", multiple=True,
+              help="Only mine commits touching this path (repeatable)")
 @click.option("--no-claude-md", is_flag=True,
               help="Do not create or modify CLAUDE.md (for non-Claude integrations).")
 @click.pass_context
-def init(ctx, max_commits, no_claude_md):
+def init(ctx, max_commits, paths, no_claude_md):
     """Initialize Engram in this project. Seeds from git history."""
+    from engram.init import perform_init
     project = ctx.obj["project"]
 
-    result = perform_init(project, max_commits=max_commits)
+    result = perform_init(project, max_commits=max_commits, paths=list(paths) or None)
 
     if result.already_initialized:
         click.echo(f"Engram already initialized in {project}")
@@ -121,7 +181,7 @@ def init(ctx, max_commits, no_claude_md):
 
 @cli.command()
 @click.option("--type", "-t", "event_type", required=True,
-              type=click.Choice(["discovery", "decision", "warning", "mutation", "outcome"]))
+              type=_EVENT_TYPE_CHOICE)
 @click.option("--content", "-c", required=True, help="Event content (max 2000 chars)")
 @click.option("--scope", "-s", multiple=True, help="File path(s)")
 @click.option("--area", "-A", "area", default=None,
@@ -130,20 +190,26 @@ def init(ctx, max_commits, no_claude_md):
 @click.option("--agent", "-a", default=None, help="Agent identifier")
 @click.option("--related", "-r", multiple=True, help="Related event ID(s)")
 @click.option("--priority", "-p", default="normal",
-              type=click.Choice(["critical", "high", "normal", "low"]),
+              type=_PRIORITY_CHOICE,
               help="Event priority (default: normal)")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def post(ctx, event_type, content, scope, area, agent, related, priority, fmt):
     """Post an event to the store."""
+    from engram.areas import infer_area, load_area_map
+    from engram.formatting import format_compact, format_json
+    from engram.models import EVENT_TYPE_BY_VALUE, Event
+    from engram.validation import validate_content
+    try:
+        validate_content(content)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    if len(content) > 2000:
-        click.echo("Error: Content exceeds 2000 character limit.", err=True)
-        sys.exit(1)
-
     agent_id = agent or os.environ.get("ENGRAM_AGENT_ID", "cli")
     scope_list = list(scope) if scope else None
     related_list = list(related) if related else None
@@ -152,7 +218,7 @@ def post(ctx, event_type, content, scope, area, agent, related, priority, fmt):
 
     event = Event(
         id="", timestamp="",
-        event_type=EventType(event_type),
+        event_type=EVENT_TYPE_BY_VALUE[event_type],  # validated by click
         agent_id=agent_id,
         content=content,
         scope=scope_list,
@@ -167,8 +233,6 @@ def post(ctx, event_type, content, scope, area, agent, related, priority, fmt):
     else:
         click.echo(format_compact([result]))
 
-    store.close()
-
 
 @cli.command()
 @click.argument("text", required=False)
@@ -180,26 +244,25 @@ def post(ctx, event_type, content, scope, area, agent, related, priority, fmt):
 @click.option("--related-to", default=None, help="Find events related to this event ID")
 @click.option("--limit", "-n", default=50, help="Max results")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def query(ctx, text, event_type, scope, area, since, agent, related_to, limit, fmt):
     """Query events. Supports FTS text and/or structured filters."""
+    from engram.formatting import write_compact, write_json
+    from engram.query import QueryEngine, parse_event_types
     project = ctx.obj["project"]
     store = _get_store(project)
 
     types = parse_event_types(event_type) if event_type else None
     engine = QueryEngine(store)
-    results = engine.execute(
+    results = engine.execute_iter(
         text=text, event_types=types, agent_id=agent,
         scope=scope, area=area, since=since, limit=limit, related_to=related_to,
     )
 
-    if fmt == "json":
-        click.echo(format_json(results))
-    else:
-        click.echo(format_compact(results))
-
-    store.close()
+    # Rows are formatted and written as they are read, never all held at once
+    write = write_json if fmt == "json" else write_compact
+    write(results, sys.stdout)
 
 
 @cli.command()
@@ -210,65 +273,73 @@ def query(ctx, text, event_type, scope, area, since, agent, related_to, limit, f
               help="Hours to show recently resolved events (default: 48)")
 @click.option("--full", is_flag=True, help="Include latest checkpoint context + dynamic activity")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def briefing(ctx, scope, since, focus, resolved_window, full, fmt):
     """Generate a project briefing."""
+    from engram.briefing import BriefingGenerator
+    from engram.formatting import format_briefing_compact, format_briefing_json
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    try:
-        if full:
-            from engram.checkpoint import CheckpointEngine
-            engine = CheckpointEngine(store, project_dir=project)
-            output = engine.restore(scope=scope, since=since, focus=focus)
-            click.echo(output)
-            return
+    if full:
+        from engram.checkpoint import CheckpointEngine
+        engine = CheckpointEngine(store, project_dir=project)
+        output = engine.restore(scope=scope, since=since, focus=focus)
+        click.echo(output)
+        return
 
-        gen = BriefingGenerator(store)
-        result = gen.generate(scope=scope, since=since, focus=focus,
-                              resolved_window_hours=resolved_window)
+    gen = BriefingGenerator(store)
+    result = gen.generate(scope=scope, since=since, focus=focus,
+                          resolved_window_hours=resolved_window)
+
+    if fmt == "json":
+        click.echo(format_briefing_json(result))
+    else:
+        click.echo(format_briefing_compact(result))
 
-        if fmt == "json":
-            click.echo(format_briefing_json(result))
-        else:
-            click.echo(format_briefing_compact(result))
-    finally:
-        store.close()
+
+# Compact status output, written in one call
+_STATUS_TEMPLATE = (
+    "Project:      {project_name}\n"
+    "Events:       {total}\n"
+    "Last activity: {last}\n"
+    "Initialized:  {initialized}\n"
+    "DB size:      {db_size:,} bytes\n"
+)
 
 
 @cli.command()
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def status(ctx, fmt):
     """Show Engram status."""
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    total = store.count()
-    last = store.last_activity()
-    project_name = store.get_meta("project_name") or "unknown"
-    initialized = store.get_meta("initialized_at") or "unknown"
-    db_size = (project / ENGRAM_DIR / DB_NAME).stat().st_size
+    total, last, project_name, initialized = store.status_snapshot()
+    project_name = project_name or "unknown"
+    initialized = initialized or "unknown"
+    # Under WAL, recent writes live in the -wal sidecar until checkpointed.
+    # One directory listing finds whichever of the three files exist.
+    with os.scandir(_db_path(project).parent) as entries:
+        db_size = sum(e.stat().st_size for e in entries if e.name in _DB_FILES)
 
     if fmt == "json":
-        import json
-        click.echo(json.dumps({
+        from engram._json import write_pretty
+        write_pretty({
             "project_name": project_name,
             "total_events": total,
             "last_activity": last,
             "initialized_at": initialized,
             "db_size_bytes": db_size,
-        }, indent=2))
+        }, sys.stdout)
     else:
-        click.echo(f"Project:      {project_name}")
-        click.echo(f"Events:       {total}")
-        click.echo(f"Last activity: {last or 'none'}")
-        click.echo(f"Initialized:  {initialized}")
-        click.echo(f"DB size:      {db_size:,} bytes")
-
-    store.close()
+        click.echo(_STATUS_TEMPLATE.format(
+            project_name=project_name, total=total, last=last or "none",
+            initialized=initialized, db_size=db_size,
+        ), nl=False)
 
 
 @cli.command()
@@ -285,7 +356,7 @@ def gc(ctx, max_age, dry_run):
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    collector = GarbageCollector(store, project / ENGRAM_DIR)
+    collector = GarbageCollector(store, _db_path(project).parent)
     result = collector.collect(max_age_days=max_age, dry_run=dry_run)
 
     if dry_run:
@@ -295,8 +366,6 @@ def gc(ctx, max_age, dry_run):
     else:
         click.echo(f"Archived {result['archived']} events to {result['archive_path']}.")
 
-    store.close()
-
 
 # --- Event lifecycle commands ---
 
@@ -324,8 +393,6 @@ def resolve(ctx, event_id, reason):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 @cli.command()
@@ -338,12 +405,12 @@ def supersede(ctx, event_id, new_event_id):
     store = _get_store(project)
 
     try:
-        old = store.get_event(event_id)
+        events = store.get_events([event_id, new_event_id])
+        old = events.get(event_id)
         if not old:
             click.echo(f"Error: Event not found: {event_id}", err=True)
             sys.exit(1)
-        new = store.get_event(new_event_id)
-        if not new:
+        if new_event_id not in events:
             click.echo(f"Error: Superseding event not found: {new_event_id}", err=True)
             sys.exit(1)
         if old.status != "active":
@@ -355,8 +422,6 @@ def supersede(ctx, event_id, new_event_id):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 @cli.command()
@@ -384,8 +449,6 @@ def reopen(ctx, event_id):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 # --- Checkpoint commands ---
@@ -395,7 +458,7 @@ def reopen(ctx, event_id):
 @click.option("--agent", "-a", default=None, help="Agent identifier")
 @click.option("--no-enrich", is_flag=True, help="Skip enrichment of context file")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def checkpoint(ctx, file_path, agent, no_enrich, fmt):
     """Save a context checkpoint. Records the checkpoint and enriches the file with Engram data."""
@@ -429,8 +492,6 @@ def checkpoint(ctx, file_path, agent, no_enrich, fmt):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 # --- Session commands ---
@@ -447,7 +508,7 @@ def session(ctx):
 @click.option("--scope", "-s", multiple=True, help="File path(s) for this session")
 @click.option("--agent", "-a", default=None, help="Agent identifier")
 @click.option("--description", "-d", default=None, help="Longer description of intent")
-@click.option("--format", "fmt", default="compact", type=click.Choice(["compact", "json"]))
+@click.option("--format", "fmt", default="compact", type=_FMT_CHOICE)
 @click.pass_context
 def session_start(ctx, focus, scope, agent, description, fmt):
     """Start a new session. Auto-ends any active session for this agent."""
@@ -459,28 +520,25 @@ def session_start(ctx, focus, scope, agent, description, fmt):
     agent_id = agent or os.environ.get("ENGRAM_AGENT_ID", "cli")
     scope_list = list(scope) if scope else None
 
-    try:
-        # Stale cleanup
-        store.cleanup_stale_sessions()
+    # Stale cleanup
+    store.cleanup_stale_sessions()
 
-        # Auto-end previous active session
-        active = store.get_active_session(agent_id)
-        if active:
-            store.end_session(active.id)
-            click.echo(f"Ended previous session: {active.id}")
+    # Auto-end previous active session
+    active = store.get_active_session(agent_id)
+    if active:
+        store.end_session(active.id)
+        click.echo(f"Ended previous session: {active.id}")
 
-        sess = Session(
-            id="", agent_id=agent_id, focus=focus,
-            scope=scope_list, description=description,
-        )
-        result = store.insert_session(sess)
+    sess = Session(
+        id="", agent_id=agent_id, focus=focus,
+        scope=scope_list, description=description,
+    )
+    result = store.insert_session(sess)
 
-        if fmt == "json":
-            click.echo(format_sessions_json([result]))
-        else:
-            click.echo(format_session_compact(result))
-    finally:
-        store.close()
+    if fmt == "json":
+        click.echo(format_sessions_json([result]))
+    else:
+        click.echo(format_session_compact(result))
 
 
 @session.command("end")
@@ -509,13 +567,11 @@ def session_end(ctx, session_id, agent):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 @session.command("ls")
 @click.option("--all", "show_all", is_flag=True, help="Include ended sessions")
-@click.option("--format", "-f", "fmt", default="compact", type=click.Choice(["compact", "json"]))
+@click.option("--format", "-f", "fmt", default="compact", type=_FMT_CHOICE)
 @click.pass_context
 def session_ls(ctx, show_all, fmt):
     """List sessions. Active only by default."""
@@ -523,22 +579,19 @@ def session_ls(ctx, show_all, fmt):
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    try:
-        store.cleanup_stale_sessions()
-        sessions = store.list_sessions(active_only=not show_all)
+    store.cleanup_stale_sessions()
+    sessions = store.list_sessions(active_only=not show_all)
 
-        if fmt == "json":
-            click.echo(format_sessions_json(sessions))
-        else:
-            click.echo(format_sessions_compact(sessions))
-    finally:
-        store.close()
+    if fmt == "json":
+        click.echo(format_sessions_json(sessions))
+    else:
+        click.echo(format_sessions_compact(sessions))
 
 
 @session.command("show")
 @click.argument("session_id", required=False)
 @click.option("--agent", "-a", default=None, help="Agent identifier")
-@click.option("--format", "-f", "fmt", default="compact", type=click.Choice(["compact", "json"]))
+@click.option("--format", "-f", "fmt", default="compact", type=_FMT_CHOICE)
 @click.pass_context
 def session_show(ctx, session_id, agent, fmt):
     """Show details of a session. Defaults to the current active session."""
@@ -548,26 +601,23 @@ def session_show(ctx, session_id, agent, fmt):
 
     agent_id = agent or os.environ.get("ENGRAM_AGENT_ID", "cli")
 
-    try:
-        store.cleanup_stale_sessions()
+    store.cleanup_stale_sessions()
 
-        if not session_id:
-            sess = store.get_active_session(agent_id)
-            if not sess:
-                click.echo(f"No active session for agent '{agent_id}'.", err=True)
-                sys.exit(1)
-        else:
-            sess = store.get_session(session_id)
-            if not sess:
-                click.echo(f"Session not found: {session_id}", err=True)
-                sys.exit(1)
+    if not session_id:
+        sess = store.get_active_session(agent_id)
+        if not sess:
+            click.echo(f"No active session for agent '{agent_id}'.", err=True)
+            sys.exit(1)
+    else:
+        sess = store.get_session(session_id)
+        if not sess:
+            click.echo(f"Session not found: {session_id}", err=True)
+            sys.exit(1)
 
-        if fmt == "json":
-            click.echo(format_sessions_json([sess]))
-        else:
-            click.echo(format_session_compact(sess))
-    finally:
-        store.close()
+    if fmt == "json":
+        click.echo(format_sessions_json([sess]))
+    else:
+        click.echo(format_session_compact(sess))
 
 
 # --- Consultation commands ---
@@ -581,17 +631,17 @@ def consult(ctx):
 
 @consult.command("models")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def consult_models(ctx, fmt):
     """List available consultation models (builtin + project overrides)."""
-    import json as _json
     from engram.providers import resolve_models, model_summary
     project = ctx.obj["project"]
     rows = model_summary(resolve_models(project))
 
     if fmt == "json":
-        click.echo(_json.dumps(rows, indent=2))
+        from engram._json import write_pretty
+        write_pretty(rows, sys.stdout)
         return
 
     for r in rows:
@@ -618,12 +668,12 @@ def consult_models(ctx, fmt):
 @click.pass_context
 def consult_start(ctx, topic, models, system, context, message, file_path):
     """Start a new consultation."""
-    from engram.consult import ConsultationEngine
+    from engram.consult import ConsultationEngine, parse_models
     from engram.context import ContextAssembler
     project = ctx.obj["project"]
     store = _get_store(project)
 
-    model_list = [m.strip() for m in models.split(",")]
+    model_list = parse_models(models)
 
     # Handle file input
     if file_path:
@@ -632,7 +682,6 @@ def consult_start(ctx, topic, models, system, context, message, file_path):
             filename, file_content = read_file_for_consultation(file_path)
         except ValueError as e:
             click.echo(f"Error: {e}", err=True)
-            store.close()
             sys.exit(1)
 
         if not topic:
@@ -644,7 +693,6 @@ def consult_start(ctx, topic, models, system, context, message, file_path):
 
     if not topic:
         click.echo("Error: --topic is required when --file is not provided", err=True)
-        store.close()
         sys.exit(1)
 
     engine = ConsultationEngine(store, project_dir=project)
@@ -681,7 +729,7 @@ def consult_start(ctx, topic, models, system, context, message, file_path):
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     finally:
-        store.close()
+        engine.flush_logs()
 
 
 @consult.command("say")
@@ -691,7 +739,7 @@ def consult_start(ctx, topic, models, system, context, message, file_path):
 @click.pass_context
 def consult_say(ctx, conv_id, message, models):
     """Send a message and get responses."""
-    from engram.consult import ConsultationEngine
+    from engram.consult import ConsultationEngine, parse_models
     project = ctx.obj["project"]
     store = _get_store(project)
     engine = ConsultationEngine(store, project_dir=project)
@@ -700,7 +748,7 @@ def consult_say(ctx, conv_id, message, models):
         engine.add_message(conv_id, message)
         click.echo(f"> {message}\n")
 
-        model_list = [m.strip() for m in models.split(",")] if models else None
+        model_list = parse_models(models) if models else None
         responses = engine.get_responses(conv_id, models=model_list)
         for r in responses:
             click.echo(f"--- {r['sender']} ---")
@@ -710,17 +758,16 @@ def consult_say(ctx, conv_id, message, models):
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     finally:
-        store.close()
+        engine.flush_logs()
 
 
 @consult.command("show")
 @click.argument("conv_id")
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def consult_show(ctx, conv_id, fmt):
     """Show full conversation history."""
-    import json as _json
     from engram.consult import ConsultationEngine
     project = ctx.obj["project"]
     store = _get_store(project)
@@ -733,31 +780,20 @@ def consult_show(ctx, conv_id, fmt):
         sys.exit(1)
 
     if fmt == "json":
-        click.echo(_json.dumps(conv, indent=2))
+        from engram._json import write_pretty
+        write_pretty(conv, sys.stdout)
     else:
-        click.echo(f"# {conv['topic']} [{conv['status']}]")
-        click.echo(f"ID: {conv['id']} | Models: {', '.join(conv['models'])}")
-        if conv["system_prompt"]:
-            click.echo(f"System: {conv['system_prompt']}")
-        click.echo()
-        for msg in conv["messages"]:
-            click.echo(f"[{msg['sender']}] ({msg['role']}):")
-            click.echo(msg["content"])
-            click.echo()
-        if conv["summary"]:
-            click.echo(f"Summary: {conv['summary']}")
-
-    store.close()
+        from engram.formatting import format_conversation_lines
+        sys.stdout.writelines(format_conversation_lines(conv))
 
 
 @consult.command("ls")
-@click.option("--status", default=None, type=click.Choice(["active", "paused", "completed"]))
+@click.option("--status", default=None, type=_CONV_STATUS_CHOICE)
 @click.option("--format", "-f", "fmt", default="compact",
-              type=click.Choice(["compact", "json"]))
+              type=_FMT_CHOICE)
 @click.pass_context
 def consult_ls(ctx, status, fmt):
     """List consultations."""
-    import json as _json
     from engram.consult import ConsultationEngine
     project = ctx.obj["project"]
     store = _get_store(project)
@@ -766,18 +802,11 @@ def consult_ls(ctx, status, fmt):
     convs = engine.list_conversations(status=status)
 
     if fmt == "json":
-        click.echo(_json.dumps(convs, indent=2))
+        from engram._json import write_pretty
+        write_pretty(convs, sys.stdout)
     else:
-        if not convs:
-            click.echo("(no consultations)")
-        else:
-            for c in convs:
-                click.echo(
-                    f"{c['id']} [{c['status']}] {c['topic']} "
-                    f"({c['message_count']} msgs, {', '.join(c['models'])})"
-                )
-
-    store.close()
+        from engram.formatting import format_conversations_lines
+        sys.stdout.writelines(format_conversations_lines(convs))
 
 
 @consult.command("done")
@@ -800,13 +829,13 @@ def consult_done(ctx, conv_id, summary):
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     finally:
-        store.close()
+        engine.flush_logs()
 
 
 @consult.command("extract")
 @click.argument("conv_id")
 @click.option("--type", "-t", "event_type", required=True,
-              type=click.Choice(["discovery", "decision", "warning"]))
+              type=_EXTRACT_TYPE_CHOICE)
 @click.option("--content", "-c", required=True, help="Event content to extract")
 @click.pass_context
 def consult_extract(ctx, conv_id, event_type, content):
@@ -822,8 +851,6 @@ def consult_extract(ctx, conv_id, event_type, content):
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
-    finally:
-        store.close()
 
 
 # --- Hook management (user-facing) ---
@@ -894,23 +921,34 @@ def hook(ctx):
 @click.pass_context
 def hook_post_tool_use(ctx):
     """Handle PostToolUse hook. Reads JSON from stdin."""
-    import json as _json
-    data = _json.load(sys.stdin)
-    project_dir = Path(data.get("cwd", str(ctx.obj["project"]))).resolve()
-
-    from engram.hooks import handle_post_tool_use
-    handle_post_tool_use(data, project_dir)
+    from engram.hook_entry import post_tool_use
+    post_tool_use(str(ctx.obj["project"]))
 
 
 @hook.command("session-start")
 @click.pass_context
 def hook_session_start(ctx):
     """Handle SessionStart hook. Outputs briefing to stdout."""
-    import json as _json
-    data = _json.load(sys.stdin)
-    project_dir = Path(data.get("cwd", str(ctx.obj["project"]))).resolve()
+    from engram.hook_entry import session_start
+    session_start(str(ctx.obj["project"]))
 
-    from engram.hooks import handle_session_start
-    output = handle_session_start(data, project_dir)
-    if output:
-        click.echo(output)
+
+def main() -> None:
+    """Console entry point.
+
+    `engram hook <name>` (the command line older hook installs still use)
+    is routed straight to its handler without click parsing the command
+    line, and `engram --version` is answered the same way; every other
+    invocation goes through the `cli` group.
+    """
+    args = sys.argv[1:]
+    if args == ["--version"] or args == ["-V"]:
+        print(f"engram, version {__version__}")
+        return
+    if len(args) == 2 and args[0] == "hook":
+        from engram import hook_entry
+        if args[1] == "post-tool-use":
+            return hook_entry.post_tool_use()
+        if args[1] == "session-start":
+            return hook_entry.session_start()
+    cli()
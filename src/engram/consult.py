@@ -1,10 +1,15 @@
 """ConsultationEngine — multi-turn AI conversations with persistent storage."""
 
+import functools
 import json
+import sqlite3
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from engram._json import loads
 from engram.models import Event, EventType
 from engram.store import EventStore
 from engram import providers
@@ -63,6 +68,73 @@ def format_file_message(
     return f"{prompt}\n\n**File: `{filename}`**\n\n```{lang}\n{content}\n```"
 
 
+def parse_models(models: str) -> list[str]:
+    """Parse a comma-separated model list ("gpt-4o, gemini-flash")."""
+    return list(_parse_models(models))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_models(models: str) -> tuple[str, ...]:
+    # Cached as a tuple, like query._parse_event_types: the same model
+    # lists are passed on every start/say call.
+    return tuple(m for m in (part.strip() for part in models.split(",")) if m)
+
+
+# One API message per user row, and one per run of assistant replies between
+# user rows ("turn"), joined in id order as "[sender]: content" blocks. The
+# running group_concat window is ordered, so its last row in each run holds
+# the whole run; LEAD() finds that row.
+_API_MESSAGES_SQL = """
+WITH tagged AS (
+    SELECT id, role, sender, content,
+           SUM(role = 'user') OVER (ORDER BY id) AS turn
+    FROM conversation_messages
+    WHERE conv_id = ? AND role IN ('user', 'assistant')
+), runs AS (
+    SELECT id, role,
+           CASE role
+               WHEN 'user' THEN content
+               ELSE group_concat('[' || sender || ']: ' || content, char(10, 10))
+                    OVER (PARTITION BY turn, role ORDER BY id)
+           END AS content,
+           LEAD(id) OVER (PARTITION BY turn, role ORDER BY id) AS next_id
+    FROM tagged
+)
+SELECT role, content FROM runs WHERE next_id IS NULL ORDER BY id
+"""
+
+
+# Markdown logs are rewritten in full after every change, on one background
+# writer so callers don't wait on rendering and disk. Only the newest queued
+# snapshot of a conversation is written; older ones it replaced are dropped.
+_log_lock = threading.Lock()
+_log_pending: dict[Path, tuple[dict, Future]] = {}
+_log_writer: ThreadPoolExecutor | None = None
+
+
+def _write_log(log_path: Path) -> None:
+    with _log_lock:
+        conv, _ = _log_pending.pop(log_path)
+    text = ConsultationEngine._render_log(conv)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path.write_text(text, encoding="utf-8")
+
+
+def _queue_log(log_path: Path, conv: dict) -> Future:
+    """Queue a log write, folding it into one already queued for the path."""
+    global _log_writer
+    with _log_lock:
+        if log_path in _log_pending:
+            future = _log_pending[log_path][1]
+        else:
+            if _log_writer is None:
+                _log_writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="engram-log")
+            future = _log_writer.submit(_write_log, log_path)
+        _log_pending[log_path] = (conv, future)
+        return future
+
+
 class ConsultationEngine:
     """Manages multi-turn conversations with external AI models."""
 
@@ -72,6 +144,8 @@ class ConsultationEngine:
         # Builtin frontier models plus any project overrides from
         # .engram/models.json — used for validation and dispatch.
         self.models = providers.resolve_models(self.project_dir)
+        # log path -> latest queued write, for flush_logs()
+        self._log_writes: dict[Path, Future] = {}
 
     @staticmethod
     def _generate_id() -> str:
@@ -98,8 +172,8 @@ class ConsultationEngine:
         conv_id = self._generate_id()
         now = self._now_iso()
 
-        with self.store.conn:
-            self.store.conn.execute(
+        with self.store.transaction() as conn:
+            conn.execute(
                 "INSERT INTO conversations (id, topic, status, models, system_prompt, created_at, updated_at) "
                 "VALUES (?, ?, 'active', ?, ?, ?, ?)",
                 (conv_id, topic, json.dumps(models), system_prompt, now, now),
@@ -115,13 +189,13 @@ class ConsultationEngine:
             raise ValueError(f"Conversation {conv_id} is {conv['status']}, not active.")
 
         now = self._now_iso()
-        with self.store.conn:
-            cursor = self.store.conn.execute(
+        with self.store.transaction() as conn:
+            cursor = conn.execute(
                 "INSERT INTO conversation_messages (conv_id, role, sender, content, created_at) "
                 "VALUES (?, 'user', ?, ?, ?)",
                 (conv_id, sender, content, now),
             )
-            self.store.conn.execute(
+            conn.execute(
                 "UPDATE conversations SET updated_at = ? WHERE id = ?",
                 (now, conv_id),
             )
@@ -139,108 +213,116 @@ class ConsultationEngine:
 
     def get_responses(self, conv_id: str, models: list[str] | None = None) -> list[dict]:
         """Call each model with full history, save responses. Returns new responses."""
-        conv = self._get_conv_row(conv_id)
+        conv, conv_models = self._get_conv(conv_id)
         if conv["status"] != "active":
             raise ValueError(f"Conversation {conv_id} is {conv['status']}, not active.")
 
-        conv_models = json.loads(conv["models"])
         target_models = models or conv_models
         system_prompt = conv["system_prompt"]
 
         # Build message history for API calls
         api_messages = self._build_api_messages(conv_id)
 
-        responses = []
         now = self._now_iso()
 
-        for model_key in target_models:
+        def ask(model_key: str) -> str:
             try:
-                response_text = providers.send_message(
+                return providers.send_message(
                     model_key, api_messages, system_prompt, models=self.models
                 )
             except Exception as e:
-                response_text = f"[Error from {model_key}: {e}]"
+                return f"[Error from {model_key}: {e}]"
+
+        # The models are independent HTTP round trips: ask them all at once,
+        # so a round takes as long as the slowest model, not the sum.
+        if len(target_models) > 1:
+            with ThreadPoolExecutor(max_workers=len(target_models)) as pool:
+                texts = list(pool.map(ask, target_models))
+        else:
+            texts = [ask(m) for m in target_models]
+        replies = list(zip(target_models, texts))
 
-            with self.store.conn:
-                cursor = self.store.conn.execute(
+        # All replies land in one commit, once every model has answered; the
+        # write transaction is never held open across a network call.
+        responses = []
+        with self.store.transaction() as conn:
+            for model_key, response_text in replies:
+                cursor = conn.execute(
                     "INSERT INTO conversation_messages (conv_id, role, sender, content, created_at) "
                     "VALUES (?, 'assistant', ?, ?, ?)",
                     (conv_id, model_key, response_text, now),
                 )
-                self.store.conn.execute(
-                    "UPDATE conversations SET updated_at = ? WHERE id = ?",
-                    (now, conv_id),
-                )
-
-            responses.append({
-                "id": cursor.lastrowid,
-                "conv_id": conv_id,
-                "role": "assistant",
-                "sender": model_key,
-                "content": response_text,
-                "created_at": now,
-            })
+                responses.append({
+                    "id": cursor.lastrowid,
+                    "conv_id": conv_id,
+                    "role": "assistant",
+                    "sender": model_key,
+                    "content": response_text,
+                    "created_at": now,
+                })
+            conn.execute(
+                "UPDATE conversations SET updated_at = ? WHERE id = ?",
+                (now, conv_id),
+            )
 
         self._save_log(conv_id)
         return responses
 
     def get_conversation(self, conv_id: str) -> dict:
         """Return full conversation with metadata + messages."""
-        conv = self._get_conv_row(conv_id)
+        conv, conv_models = self._get_conv(conv_id)
         messages = self.store.conn.execute(
-            "SELECT * FROM conversation_messages WHERE conv_id = ? ORDER BY id",
+            "SELECT id, role, sender, content, created_at"
+            " FROM conversation_messages WHERE conv_id = ? ORDER BY id",
             (conv_id,),
-        ).fetchall()
+        )
 
         return {
             "id": conv["id"],
             "topic": conv["topic"],
             "status": conv["status"],
-            "models": json.loads(conv["models"]),
+            "models": list(conv_models),
             "system_prompt": conv["system_prompt"],
             "created_at": conv["created_at"],
             "updated_at": conv["updated_at"],
             "summary": conv["summary"],
+            # Rows unpack positionally, in the order of the SELECT above
             "messages": [
-                {
-                    "id": m["id"],
-                    "role": m["role"],
-                    "sender": m["sender"],
-                    "content": m["content"],
-                    "created_at": m["created_at"],
-                }
-                for m in messages
+                {"id": mid, "role": role, "sender": sender,
+                 "content": content, "created_at": created_at}
+                for mid, role, sender, content, created_at in messages
             ],
         }
 
     def list_conversations(self, status: str | None = None, limit: int = 20) -> list[dict]:
         """List conversations, optionally filtered by status."""
+        # Counts come from a correlated subquery on the (conv_id, id) index,
+        # so the listing is one statement instead of one COUNT per row.
+        sql = (
+            "SELECT c.id, c.topic, c.status, c.models, c.created_at, c.updated_at,"
+            " c.summary, (SELECT COUNT(*) FROM conversation_messages m"
+            " WHERE m.conv_id = c.id) FROM conversations c"
+        )
         if status:
-            rows = self.store.conn.execute(
-                "SELECT * FROM conversations WHERE status = ? ORDER BY updated_at DESC LIMIT ?",
-                (status, limit),
-            ).fetchall()
+            sql += " WHERE c.status = ?"
+            params: tuple = (status, limit)
         else:
-            rows = self.store.conn.execute(
-                "SELECT * FROM conversations ORDER BY updated_at DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
+            params = (limit,)
+        sql += " ORDER BY c.updated_at DESC LIMIT ?"
 
         return [
             {
-                "id": r["id"],
-                "topic": r["topic"],
-                "status": r["status"],
-                "models": json.loads(r["models"]),
-                "created_at": r["created_at"],
-                "updated_at": r["updated_at"],
-                "summary": r["summary"],
-                "message_count": self.store.conn.execute(
-                    "SELECT COUNT(*) as cnt FROM conversation_messages WHERE conv_id = ?",
-                    (r["id"],),
-                ).fetchone()["cnt"],
+                "id": cid,
+                "topic": topic,
+                "status": row_status,
+                "models": loads(models),
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "summary": summary,
+                "message_count": message_count,
             }
-            for r in rows
+            for (cid, topic, row_status, models, created_at, updated_at,
+                 summary, message_count) in self.store.conn.execute(sql, params)
         ]
 
     def complete(self, conv_id: str, summary: str | None = None) -> dict:
@@ -248,12 +330,11 @@ class ConsultationEngine:
         conv = self._get_conv_row(conv_id)
         now = self._now_iso()
 
-        with self.store.conn:
-            self.store.conn.execute(
+        with self.store.transaction() as conn:
+            conn.execute(
                 "UPDATE conversations SET status = 'completed', summary = ?, updated_at = ? WHERE id = ?",
                 (summary, now, conv_id),
             )
-
         self._save_log(conv_id)
         return self.get_conversation(conv_id)
 
@@ -271,7 +352,7 @@ class ConsultationEngine:
         result = self.store.insert(event)
         return result.id
 
-    def _get_conv_row(self, conv_id: str):
+    def _get_conv_row(self, conv_id: str) -> sqlite3.Row:
         """Fetch conversation row, raise if not found."""
         row = self.store.conn.execute(
             "SELECT * FROM conversations WHERE id = ?", (conv_id,)
@@ -280,44 +361,21 @@ class ConsultationEngine:
             raise ValueError(f"Conversation not found: {conv_id}")
         return row
 
+    def _get_conv(self, conv_id: str) -> tuple[sqlite3.Row, list[str]]:
+        """Conversation row and its parsed models list."""
+        row = self._get_conv_row(conv_id)
+        return row, loads(row["models"])
+
     def _build_api_messages(self, conv_id: str) -> list[dict]:
         """Build alternating user/assistant messages from conversation history.
 
         When multiple models respond in the same round, their responses are
         concatenated with sender labels into a single assistant message.
         """
-        rows = self.store.conn.execute(
-            "SELECT * FROM conversation_messages WHERE conv_id = ? ORDER BY id",
-            (conv_id,),
-        ).fetchall()
-
-        api_messages = []
-        pending_assistant: list[str] = []
-
-        for row in rows:
-            if row["role"] == "user":
-                # Flush any pending assistant messages
-                if pending_assistant:
-                    api_messages.append({
-                        "role": "assistant",
-                        "content": "\n\n".join(pending_assistant),
-                    })
-                    pending_assistant = []
-                api_messages.append({
-                    "role": "user",
-                    "content": row["content"],
-                })
-            elif row["role"] == "assistant":
-                pending_assistant.append(
-                    f"[{row['sender']}]: {row['content']}"
-                )
-
-        # Flush remaining assistant messages
-        if pending_assistant:
-            api_messages.append({
-                "role": "assistant",
-                "content": "\n\n".join(pending_assistant),
-            })
+        api_messages = [
+            {"role": role, "content": content}
+            for role, content in self.store.conn.execute(_API_MESSAGES_SQL, (conv_id,))
+        ]
 
         # Token management: truncate if too long
         api_messages = self._truncate_if_needed(api_messages)
@@ -330,18 +388,17 @@ class ConsultationEngine:
         if total_chars <= MAX_INPUT_CHARS or len(messages) <= 2:
             return messages
 
-        # Keep first message + last N messages, truncate middle
+        # Keep first message + last N messages, truncate middle: drop from
+        # the front of the rest (keeping at least one) until under the limit,
+        # taking each dropped message off the running total.
         first = messages[0]
-        remaining = messages[1:]
-
-        # Remove from the front of remaining until under limit
-        while len(remaining) > 1:
-            total_chars = len(first["content"]) + sum(len(m["content"]) for m in remaining)
-            if total_chars <= MAX_INPUT_CHARS:
-                break
-            remaining.pop(0)
+        start = 1
+        while start < len(messages) - 1 and total_chars > MAX_INPUT_CHARS:
+            total_chars -= len(messages[start]["content"])
+            start += 1
+        remaining = messages[start:]
 
-        truncated_count = len(messages) - 1 - len(remaining)
+        truncated_count = start - 1
         if truncated_count > 0:
             marker = {
                 "role": "user",
@@ -351,14 +408,24 @@ class ConsultationEngine:
 
         return [first] + remaining
 
-    def _save_log(self, conv_id: str) -> Path:
-        """Write/overwrite markdown log to docs/consultations/{conv_id}.md."""
-        conv = self.get_conversation(conv_id)
+    def flush_logs(self) -> None:
+        """Wait for this engine's queued log writes; re-raises a failed write."""
+        writes, self._log_writes = self._log_writes, {}
+        for future in writes.values():
+            future.result()
 
-        log_dir = self.project_dir / "docs" / "consultations"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / f"{conv_id}.md"
+    def _save_log(self, conv_id: str) -> None:
+        """Queue a write/overwrite of docs/consultations/{conv_id}.md.
 
+        The file is written later, on the log writer; callers that must see it
+        (or its errors) call flush_logs().
+        """
+        log_path = self.project_dir / "docs" / "consultations" / f"{conv_id}.md"
+        self._log_writes[log_path] = _queue_log(log_path, self.get_conversation(conv_id))
+
+    @staticmethod
+    def _render_log(conv: dict) -> str:
+        """Render a conversation as the markdown consultation log."""
         lines = [
             f"# Consultation: {conv['topic']}",
             f"- ID: {conv['id']}",
@@ -371,31 +438,22 @@ class ConsultationEngine:
         if conv["system_prompt"]:
             lines.extend(["", "## System Prompt", conv["system_prompt"]])
 
-        # Group messages into turns (a turn = one user message + all assistant responses)
+        # Group messages into turns (a turn = one user message + all assistant
+        # responses): each user message opens a turn, replies join the open one
         turn_num = 0
-        messages = conv["messages"]
-        i = 0
-        while i < len(messages):
-            msg = messages[i]
+        append = lines.append
+        for msg in conv["messages"]:
             if msg["role"] == "user":
                 turn_num += 1
-                lines.extend(["", "---", "", f"## Turn {turn_num}", ""])
-                lines.append(f"**{msg['sender']}** ({msg['created_at']}):")
-                lines.append(msg["content"])
-
-                # Collect following assistant messages
-                i += 1
-                while i < len(messages) and messages[i]["role"] == "assistant":
-                    a = messages[i]
-                    lines.append("")
-                    lines.append(f"**{a['sender']}** ({a['created_at']}):")
-                    lines.append(a["content"])
-                    i += 1
+                lines.extend(("", "---", "", f"## Turn {turn_num}", ""))
+            elif not turn_num:
+                continue  # replies before the first user message have no turn
             else:
-                i += 1
+                append("")
+            append(f"**{msg['sender']}** ({msg['created_at']}):")
+            append(msg["content"])
 
         if conv["summary"]:
             lines.extend(["", "---", "", "## Summary", conv["summary"]])
 
-        log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        return log_path
+        return "\n".join(lines) + "\n"
@@ -1,5 +1,7 @@
 """Auto-context assembly for AI consultations."""
 
+import os
+from itertools import islice
 from pathlib import Path
 
 from engram.briefing import BriefingGenerator
@@ -145,23 +147,25 @@ class ContextAssembler:
     def _read_readme(self) -> str | None:
         """Read first N lines of README.md, return as string or None."""
         readme_path = self.project_dir / "README.md"
-        if not readme_path.is_file():
-            return None
-
         try:
-            lines = readme_path.read_text(encoding="utf-8").splitlines()
-            excerpt = lines[:README_MAX_LINES]
-            return "\n".join(excerpt)
+            # Read only the lines kept, not the whole file
+            with readme_path.open(encoding="utf-8") as f:
+                excerpt = "".join(islice(f, README_MAX_LINES))
         except (OSError, UnicodeDecodeError):
             return None
+        return excerpt.removesuffix("\n")
 
     def _list_source_modules(self) -> str | None:
         """List .py files in src/engram/ as a compact architecture overview."""
         src_dir = self.project_dir / "src" / "engram"
-        if not src_dir.is_dir():
+        try:
+            with os.scandir(src_dir) as entries:
+                py_files = sorted(
+                    e.name for e in entries if e.name.endswith(".py") and e.is_file()
+                )
+        except OSError:
             return None
 
-        py_files = sorted(f.name for f in src_dir.glob("*.py") if f.name != "__pycache__")
         if not py_files:
             return None
 
@@ -187,9 +191,13 @@ class ContextAssembler:
             readme_body = readme_section.split(header, 1)[-1]
             readme_lines = readme_body.splitlines()
 
-            while len("\n".join(sections)) > MAX_CONTEXT_CHARS and len(readme_lines) > 5:
+            # Length of "\n".join(sections), kept up to date as the README shrinks
+            total = sum(map(len, sections)) + len(sections) - 1
+            while total > MAX_CONTEXT_CHARS and len(readme_lines) > 5:
                 readme_lines = readme_lines[: len(readme_lines) // 2]
-                sections[readme_idx] = f"\n{header}" + "\n".join(readme_lines) + "\n[...truncated]"
+                shorter = f"\n{header}" + "\n".join(readme_lines) + "\n[...truncated]"
+                total += len(shorter) - len(sections[readme_idx])
+                sections[readme_idx] = shorter
 
         result = "\n".join(sections)
 
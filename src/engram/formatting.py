@@ -1,8 +1,11 @@
 """Output formatters for events and briefings."""
 
-import json
-from dataclasses import asdict
+import textwrap
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from typing import TextIO
 
+from engram._json import dumps_pretty
 from engram.models import BriefingResult, Checkpoint, Event, Session
 
 
@@ -35,27 +38,52 @@ def format_compact(events: list[Event]) -> str:
     """Compact multi-line output for a list of events."""
     if not events:
         return "(no events)"
-    return "\n".join(format_event_compact(e) for e in events)
+    # join() builds a list from a generator anyway; a list comp skips that step
+    return "\n".join([format_event_compact(e) for e in events])
 
 
 def format_json(events: list[Event]) -> str:
     """JSON array output."""
-    data = []
+    return dumps_pretty(events)
+
+
+def format_compact_lines(events: Iterable[Event]) -> Iterator[str]:
+    """format_compact output as newline-terminated lines, generated lazily."""
+    empty = True
     for e in events:
-        d = asdict(e)
-        d["event_type"] = e.event_type.value
-        data.append(d)
-    return json.dumps(data, indent=2)
+        empty = False
+        yield format_event_compact(e) + "\n"
+    if empty:
+        yield "(no events)\n"
+
+
+def write_compact(events: Iterable[Event], out: TextIO) -> None:
+    """Stream format_compact output (plus a trailing newline) event by event."""
+    out.writelines(format_compact_lines(events))
 
 
-def _relative_time(iso_ts: str) -> str:
-    """Convert ISO timestamp to relative time like '2h ago', '30m ago'."""
-    from datetime import datetime, timezone
+def write_json(events: Iterable[Event], out: TextIO) -> None:
+    """Stream format_json output (plus a trailing newline) event by event.
+
+    Matches format_json of the whole list without building it.
+    """
+    sep = "[\n"
+    for e in events:
+        out.write(sep)
+        out.write(textwrap.indent(dumps_pretty(e), "  "))
+        sep = ",\n"
+    out.write("[]\n" if sep == "[\n" else "\n]\n")
+
+
+def _relative_time(iso_ts: str, now: datetime | None = None) -> str:
+    """Convert ISO timestamp to relative time like '2h ago', '30m ago'.
+
+    Pass ``now`` when formatting many timestamps, so the clock is read once.
+    """
     try:
-        # Handle both +00:00 and Z suffixes
-        ts = iso_ts.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(ts)
-        delta = datetime.now(timezone.utc) - dt
+        # fromisoformat accepts both +00:00 and Z suffixes
+        dt = datetime.fromisoformat(iso_ts)
+        delta = (now or datetime.now(timezone.utc)) - dt
         seconds = int(delta.total_seconds())
         if seconds < 60:
             return "just now"
@@ -68,10 +96,10 @@ def _relative_time(iso_ts: str) -> str:
         return iso_ts[:16]
 
 
-def format_session_compact(session: Session) -> str:
+def format_session_compact(session: Session, now: datetime | None = None) -> str:
     """Single-line compact format for a session."""
     scope_part = f" ({_scope_str(session.scope)})" if session.scope else ""
-    time_part = _relative_time(session.started_at)
+    time_part = _relative_time(session.started_at, now)
     status = "active" if session.ended_at is None else "ended"
     desc = f' — {session.description}' if session.description else ""
     return f'[{session.id}] {session.agent_id}: "{session.focus}"{scope_part} — {status}, started {time_part}{desc}'
@@ -81,16 +109,13 @@ def format_sessions_compact(sessions: list[Session]) -> str:
     """Compact multi-line output for a list of sessions."""
     if not sessions:
         return "(no sessions)"
-    return "\n".join(format_session_compact(s) for s in sessions)
+    now = datetime.now(timezone.utc)
+    return "\n".join([format_session_compact(s, now) for s in sessions])
 
 
 def format_sessions_json(sessions: list[Session]) -> str:
     """JSON output for sessions."""
-    data = []
-    for s in sessions:
-        d = asdict(s)
-        data.append(d)
-    return json.dumps(data, indent=2)
+    return dumps_pretty(sessions)
 
 
 def format_checkpoint_compact(checkpoint: Checkpoint) -> str:
@@ -105,7 +130,29 @@ def format_checkpoint_compact(checkpoint: Checkpoint) -> str:
 
 def format_checkpoint_json(checkpoint: Checkpoint) -> str:
     """JSON output for a checkpoint."""
-    return json.dumps(asdict(checkpoint), indent=2)
+    return dumps_pretty(checkpoint)
+
+
+def format_conversation_lines(conv: dict) -> Iterator[str]:
+    """A consultation with its messages, as newline-terminated lines."""
+    yield f"# {conv['topic']} [{conv['status']}]\n"
+    yield f"ID: {conv['id']} | Models: {', '.join(conv['models'])}\n"
+    if conv["system_prompt"]:
+        yield f"System: {conv['system_prompt']}\n"
+    yield "\n"
+    for msg in conv["messages"]:
+        yield f"[{msg['sender']}] ({msg['role']}):\n{msg['content']}\n\n"
+    if conv["summary"]:
+        yield f"Summary: {conv['summary']}\n"
+
+
+def format_conversations_lines(convs: list[dict]) -> Iterator[str]:
+    """One newline-terminated line per consultation."""
+    if not convs:
+        yield "(no consultations)\n"
+    for c in convs:
+        yield (f"{c['id']} [{c['status']}] {c['topic']} "
+               f"({c['message_count']} msgs, {', '.join(c['models'])})\n")
 
 
 def format_briefing_compact(briefing: BriefingResult) -> str:
@@ -118,8 +165,9 @@ def format_briefing_compact(briefing: BriefingResult) -> str:
 
     if briefing.active_sessions:
         lines.append(f"## Active Sessions ({len(briefing.active_sessions)})")
+        now = datetime.now(timezone.utc)
         for s in briefing.active_sessions:
-            lines.append(format_session_compact(s))
+            lines.append(format_session_compact(s, now))
         lines.append("")
 
     if briefing.potentially_stale:
@@ -151,12 +199,4 @@ def format_briefing_compact(briefing: BriefingResult) -> str:
 
 def format_briefing_json(briefing: BriefingResult) -> str:
     """Full JSON briefing."""
-    d = asdict(briefing)
-    # Fix EventType enum serialization in all event list fields
-    event_keys = ("critical_warnings", "focus_relevant", "other_active",
-                  "recently_resolved", "recent_mutations", "potentially_stale")
-    for key in event_keys:
-        for event in d.get(key, []):
-            if hasattr(event.get("event_type"), "value"):
-                event["event_type"] = event["event_type"].value
-    return json.dumps(d, indent=2)
+    return dumps_pretty(briefing)
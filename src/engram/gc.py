@@ -58,8 +58,8 @@ class GarbageCollector:
         # Delete from main store
         ids = [r["id"] for r in archivable]
         placeholders = ",".join("?" for _ in ids)
-        with self.store.conn:
-            self.store.conn.execute(
+        with self.store.transaction() as conn:
+            conn.execute(
                 f"DELETE FROM events WHERE id IN ({placeholders})", ids
             )
 
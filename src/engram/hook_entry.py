@@ -0,0 +1,32 @@
+"""Console entry points for the Claude Code hooks.
+
+`engram-hook-post` and `engram-hook-session` run on every agent tool use
+and session start, so they are scripts of their own: read the payload,
+call the handler, exit — without importing click or the CLI.
+"""
+
+import sys
+from pathlib import Path
+
+
+def _read_payload(default_project: str) -> tuple[dict, Path]:
+    """Parse the hook's stdin JSON; the project is its cwd (else the default)."""
+    from engram._json import loads
+    data = loads(sys.stdin.buffer.read())
+    return data, Path(data.get("cwd", default_project)).resolve()
+
+
+def post_tool_use(default_project: str = ".") -> None:
+    """Handle PostToolUse: record file mutations and command outcomes."""
+    data, project_dir = _read_payload(default_project)
+    from engram.hooks import handle_post_tool_use
+    handle_post_tool_use(data, project_dir)
+
+
+def session_start(default_project: str = ".") -> None:
+    """Handle SessionStart: print the briefing for the agent's context."""
+    data, project_dir = _read_payload(default_project)
+    from engram.hooks import handle_session_start
+    output = handle_session_start(data, project_dir)
+    if output:
+        print(output)
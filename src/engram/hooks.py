@@ -14,6 +14,7 @@ from engram.store import EventStore
 from engram.briefing import BriefingGenerator
 from engram.formatting import format_briefing_compact
 from engram.init import perform_init
+from engram.validation import truncate_content
 
 ENGRAM_DIR = ".engram"
 DB_NAME = "events.db"
@@ -45,7 +46,8 @@ _STRUCT_PATTERNS: dict[str, re.Pattern] = {
     ".go": re.compile(r"^func\s+(?:\([^)]+\)\s+)?(\w+)"),
 }
 
-# Hook configuration for .claude/settings.json
+# Hook configuration for .claude/settings.json. The dedicated engram-hook-*
+# scripts skip the CLI; `engram hook <name>` still works for older installs.
 HOOK_CONFIG = {
     "hooks": {
         "PostToolUse": [
@@ -53,7 +55,7 @@ HOOK_CONFIG = {
                 "matcher": "Write|Edit",
                 "hooks": [{
                     "type": "command",
-                    "command": "engram hook post-tool-use",
+                    "command": "engram-hook-post",
                     "timeout": 10,
                 }],
             },
@@ -61,7 +63,7 @@ HOOK_CONFIG = {
                 "matcher": "Bash",
                 "hooks": [{
                     "type": "command",
-                    "command": "engram hook post-tool-use",
+                    "command": "engram-hook-post",
                     "timeout": 10,
                 }],
             },
@@ -71,7 +73,7 @@ HOOK_CONFIG = {
                 "matcher": "startup",
                 "hooks": [{
                     "type": "command",
-                    "command": "engram hook session-start",
+                    "command": "engram-hook-session",
                     "timeout": 15,
                 }],
             },
@@ -85,18 +87,16 @@ def _get_store(project_dir: Path) -> EventStore | None:
     db_path = project_dir / ENGRAM_DIR / DB_NAME
     if not db_path.exists():
         return None
-    return EventStore(db_path)
+    return EventStore(db_path, checkpoint_on_close=False)
 
 
 def _read_hook_state(project_dir: Path) -> dict:
     """Read debounce state file."""
     state_path = project_dir / ENGRAM_DIR / HOOK_STATE_FILE
-    if state_path.exists():
-        try:
-            return json.loads(state_path.read_text())
-        except (json.JSONDecodeError, OSError):
-            return {}
-    return {}
+    try:
+        return json.loads(state_path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return {}  # includes no state file yet (FileNotFoundError)
 
 
 def _write_hook_state(project_dir: Path, state: dict) -> None:
@@ -280,8 +280,7 @@ def _handle_file_mutation(tool_input: dict, stdin_data: dict,
     else:
         content = _summarize_write(rel_path, tool_input, tool_response)
 
-    if len(content) > 2000:
-        content = content[:1988] + "\n[truncated]"
+    content = truncate_content(content, "\n[truncated]")
 
     # Consistent agent_id so hook-captured events link to the session
     # registered by SessionStart. session_id on the event disambiguates runs.
@@ -342,10 +341,7 @@ def _handle_bash_outcome(tool_input: dict, stdin_data: dict,
 
     # Truncate long commands
     cmd_summary = command if len(command) <= 200 else command[:200] + "..."
-    content = f"Ran: {cmd_summary}"
-
-    if len(content) > 2000:
-        content = content[:2000]
+    content = truncate_content(f"Ran: {cmd_summary}")
 
     agent_id = "claude-code"
     active_session = store.get_active_session(agent_id)
@@ -398,18 +394,21 @@ def handle_session_start(stdin_data: dict, project_dir: Path) -> str:
     try:
         agent_id = "claude-code"
 
-        store.cleanup_stale_sessions()
+        # Session bookkeeping commits once, so the briefing (which lists
+        # the new session) isn't kept waiting on three separate commits.
+        with store.transaction():
+            store.cleanup_stale_sessions()
 
-        active = store.get_active_session(agent_id)
-        if active:
-            store.end_session(active.id)
+            active = store.get_active_session(agent_id)
+            if active:
+                store.end_session(active.id)
 
-        project_name = store.get_meta("project_name") or project_dir.name
-        sess = Session(
-            id="", agent_id=agent_id,
-            focus=f"Working on {project_name}",
-        )
-        store.insert_session(sess)
+            project_name = store.get_meta("project_name") or project_dir.name
+            sess = Session(
+                id="", agent_id=agent_id,
+                focus=f"Working on {project_name}",
+            )
+            store.insert_session(sess)
 
         gen = BriefingGenerator(store)
         briefing = gen.generate()
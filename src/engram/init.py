@@ -19,12 +19,14 @@ class InitResult:
     already_initialized: bool
 
 
-def perform_init(project_dir: Path, *, max_commits: int = 100) -> InitResult:
+def perform_init(project_dir: Path, *, max_commits: int = 100,
+                 paths: list[str] | None = None) -> InitResult:
     """Initialize Engram in a project directory. Idempotent.
 
     Creates `.engram/events.db`, sets schema, bootstraps from git history
     (when the project is a git repo), and records `project_name` +
-    `initialized_at` meta. Returns `already_initialized=True` without
+    `initialized_at` meta. `paths` limits git mining to commits touching
+    those paths. Returns `already_initialized=True` without
     further side effects when the DB already exists.
 
     NOTE: does NOT modify CLAUDE.md. Callers that want the CLAUDE.md
@@ -51,7 +53,7 @@ def perform_init(project_dir: Path, *, max_commits: int = 100) -> InitResult:
     try:
         store.initialize()
 
-        event_count = 0
+        events = []
         try:
             bootstrapper = GitBootstrapper(project_dir)
         except ValueError:
@@ -59,12 +61,15 @@ def perform_init(project_dir: Path, *, max_commits: int = 100) -> InitResult:
             project_name = project_dir.name
         else:
             project_name = bootstrapper.detect_project_name()
-            events = bootstrapper.mine_history(max_commits=max_commits)
-            if events:
-                event_count = store.insert_batch(events)
+            events = bootstrapper.mine_history(max_commits=max_commits, paths=paths)
 
-        store.set_meta("project_name", project_name)
-        store.set_meta("initialized_at", datetime.now(timezone.utc).isoformat())
+        # Seed events and meta land in one commit
+        with store.transaction():
+            event_count = store.insert_batch(events) if events else 0
+            store.set_meta("project_name", project_name)
+            store.set_meta("initialized_at", datetime.now(timezone.utc).isoformat())
+        if event_count:
+            store.optimize()
     finally:
         store.close()
 
@@ -11,6 +11,7 @@ from engram.store import EventStore
 from engram.query import QueryEngine, parse_event_types
 from engram.briefing import BriefingGenerator
 from engram.areas import load_area_map, infer_area
+from engram.validation import validate_content
 from engram.formatting import (
     format_compact, format_json,
     format_briefing_compact, format_briefing_json,
@@ -141,12 +142,7 @@ def post_event(
     """
     store = _get_store()
     try:
-        if len(content) > 2000:
-            raise ValueError(
-                f"Event content is {len(content)} chars; max is 2000. "
-                f"Summarize, or split into linked events (post the detail "
-                f"first, then reference its id via related_ids)."
-            )
+        validate_content(content)
 
         if area is None:
             project_dir = os.environ.get("ENGRAM_PROJECT_DIR", os.getcwd())
@@ -214,11 +210,11 @@ def supersede_event(event_id: str, superseded_by: str) -> str:
     """
     store = _get_store()
     try:
-        old = store.get_event(event_id)
+        events = store.get_events([event_id, superseded_by])
+        old = events.get(event_id)
         if not old:
             raise ValueError(f"Event not found: {event_id}")
-        new = store.get_event(superseded_by)
-        if not new:
+        if superseded_by not in events:
             raise ValueError(f"Superseding event not found: {superseded_by}")
         if old.status != "active":
             raise ValueError(f"Event {event_id} is {old.status}, not active.")
@@ -499,12 +495,12 @@ def start_consultation(
         system_prompt: Optional context/instructions for all models
         initial_message: If provided, sends this message and returns responses immediately
     """
-    from engram.consult import ConsultationEngine
+    from engram.consult import ConsultationEngine, parse_models
     store = _get_store()
     try:
         project_dir = Path(os.environ.get("ENGRAM_PROJECT_DIR", os.getcwd()))
         engine = ConsultationEngine(store, project_dir=project_dir)
-        model_list = [m.strip() for m in models.split(",")]
+        model_list = parse_models(models)
 
         conv_id = engine.start(topic, model_list, system_prompt=system_prompt)
         result = f"Started consultation {conv_id}\nTopic: {topic}\nModels: {', '.join(model_list)}"
@@ -516,6 +512,7 @@ def start_consultation(
             for r in responses:
                 result += f"\n--- {r['sender']} ---\n{r['content']}\n"
 
+        engine.flush_logs()
         return result
     finally:
         store.close()
@@ -541,7 +538,9 @@ def start_consultation_file(
         prompt: Custom prompt/question about the file (defaults to general review)
         system_prompt: Optional additional context/instructions for all models
     """
-    from engram.consult import ConsultationEngine, read_file_for_consultation, format_file_message
+    from engram.consult import (
+        ConsultationEngine, format_file_message, parse_models, read_file_for_consultation,
+    )
     from engram.context import ContextAssembler
 
     store = _get_store()
@@ -556,7 +555,7 @@ def start_consultation_file(
         initial_message = format_file_message(filename, file_content, prompt=prompt)
 
         # Auto-context for file consultations
-        model_list = [m.strip() for m in models.split(",")]
+        model_list = parse_models(models)
         assembler = ContextAssembler(store, project_dir=project_dir)
         auto_context = assembler.assemble_for_consultation(
             topic=topic, models=model_list,
@@ -578,6 +577,7 @@ def start_consultation_file(
         for r in responses:
             result += f"\n--- {r['sender']} ---\n{r['content']}\n"
 
+        engine.flush_logs()
         return result
     except ValueError as e:
         return f"Error: {e}"
@@ -598,19 +598,20 @@ def consult_say(
         message: Your message to the models
         models: Optional comma-separated model keys to override which models respond
     """
-    from engram.consult import ConsultationEngine
+    from engram.consult import ConsultationEngine, parse_models
     store = _get_store()
     try:
         project_dir = Path(os.environ.get("ENGRAM_PROJECT_DIR", os.getcwd()))
         engine = ConsultationEngine(store, project_dir=project_dir)
 
         engine.add_message(conv_id, message)
-        model_list = [m.strip() for m in models.split(",")] if models else None
+        model_list = parse_models(models) if models else None
         responses = engine.get_responses(conv_id, models=model_list)
 
         result = f"> {message}\n"
         for r in responses:
             result += f"\n--- {r['sender']} ---\n{r['content']}\n"
+        engine.flush_logs()
         return result
     finally:
         store.close()
@@ -661,6 +662,7 @@ def consult_done(
         project_dir = Path(os.environ.get("ENGRAM_PROJECT_DIR", os.getcwd()))
         engine = ConsultationEngine(store, project_dir=project_dir)
         engine.complete(conv_id, summary=summary)
+        engine.flush_logs()
         result = f"Completed: {conv_id}"
         if summary:
             result += f"\nSummary: {summary}"
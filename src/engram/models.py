@@ -12,7 +12,14 @@ class EventType(str, Enum):
     OUTCOME = "outcome"
 
 
-@dataclass
+# Value -> member as a plain dict: decoding a stored row is one lookup
+# rather than a trip through EnumType.__call__. For values that are already
+# known valid; an unknown one raises KeyError, not ValueError.
+EVENT_TYPE_BY_VALUE: dict[str, EventType] = {m.value: m for m in EventType}
+
+
+# slots: events are created and scanned in bulk (briefings, bootstrap)
+@dataclass(slots=True)
 class Event:
     id: str
     timestamp: str
@@ -1,6 +1,8 @@
 """Query engine with relative time parsing and filter normalization."""
 
+import functools
 import re
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
 
 from engram.models import Event, EventType, QueryFilter
@@ -47,12 +49,17 @@ def parse_since(since: str) -> str:
 
 def parse_event_types(type_str: str) -> list[EventType]:
     """Parse comma-separated event type string into list."""
-    types = []
-    for t in type_str.split(","):
-        t = t.strip().lower()
-        if t:
-            types.append(EventType(t))
-    return types
+    return list(_parse_event_types(type_str))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_event_types(type_str: str) -> tuple[EventType, ...]:
+    # Cached as a tuple so callers can't mutate the shared value; the same
+    # handful of filters ("warning", "decision,warning") recur constantly
+    # in the MCP server.
+    return tuple(
+        EventType(t) for t in (part.strip().lower() for part in type_str.split(",")) if t
+    )
 
 
 class QueryEngine:
@@ -70,8 +77,22 @@ class QueryEngine:
                 limit: int = 50,
                 related_to: str | None = None) -> list[Event]:
         """Execute a query with normalized parameters."""
+        return list(self.execute_iter(
+            text=text, event_types=event_types, agent_id=agent_id, scope=scope,
+            area=area, since=since, limit=limit, related_to=related_to,
+        ))
+
+    def execute_iter(self, text: str | None = None,
+                     event_types: list[EventType] | None = None,
+                     agent_id: str | None = None,
+                     scope: str | None = None,
+                     area: str | None = None,
+                     since: str | None = None,
+                     limit: int = 50,
+                     related_to: str | None = None) -> Iterator[Event]:
+        """Like execute, yielding events as the store reads them."""
         if related_to and not any([text, event_types, agent_id, scope, area, since]):
-            return self.store.query_related(related_to, limit)
+            return self.store.iter_related(related_to, limit)
 
         normalized_since = parse_since(since) if since else None
 
@@ -85,4 +106,4 @@ class QueryEngine:
             limit=limit,
             related_to=related_to,
         )
-        return self.store.query_structured(filters)
+        return self.store.iter_structured(filters)
@@ -3,15 +3,24 @@
 import json
 import sqlite3
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
-from engram.models import Checkpoint, Event, EventType, QueryFilter, Session
+from engram.models import (
+    EVENT_TYPE_BY_VALUE, Checkpoint, Event, EventType, QueryFilter, Session,
+)
 
-SCHEMA_VERSION = 6
+SCHEMA_VERSION = 7
 
 STALE_SESSION_HOURS = 24
 
+# Compiled statements kept per connection, keyed by SQL text. The query
+# builder emits one statement per filter combination, so the default of 128
+# could evict the fixed store and consultation queries.
+CACHED_STATEMENTS = 256
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS events (
     id          TEXT PRIMARY KEY,
@@ -34,9 +43,9 @@ CREATE TABLE IF NOT EXISTS events (
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);
-CREATE INDEX IF NOT EXISTS idx_events_type      ON events(event_type);
-CREATE INDEX IF NOT EXISTS idx_events_agent     ON events(agent_id);
-CREATE INDEX IF NOT EXISTS idx_events_status    ON events(status);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts   ON events(event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_agent_ts  ON events(agent_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_status_ts ON events(status, timestamp);
 
 CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
     content,
@@ -100,22 +109,77 @@ CREATE INDEX IF NOT EXISTS idx_sessions_agent ON sessions(agent_id);
 class EventStore:
     """SQLite-backed event store with FTS5 full-text search."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, must_exist: bool = False,
+                 checkpoint_on_close: bool = True):
         self.db_path = db_path
+        # Open with mode=rw so a missing database fails on connect instead
+        # of being created empty (raises FileNotFoundError).
+        self.must_exist = must_exist
+        # Short-lived processes (CLI commands, hooks) skip the full WAL
+        # checkpoint SQLite runs when the last connection closes; the WAL is
+        # still checkpointed passively every wal_autocheckpoint pages.
+        self.checkpoint_on_close = checkpoint_on_close
         self._conn: sqlite3.Connection | None = None
+        self._tx_depth = 0
         self._migrated = False
 
+    def _connect(self) -> sqlite3.Connection:
+        if self.must_exist:
+            try:
+                conn = sqlite3.connect(
+                    Path(self.db_path).absolute().as_uri() + "?mode=rw",
+                    uri=True, cached_statements=CACHED_STATEMENTS,
+                )
+            except sqlite3.OperationalError as e:
+                # Only a missing file means "not initialized"; an existing
+                # database that can't be opened keeps its real error.
+                if Path(self.db_path).exists():
+                    raise
+                raise FileNotFoundError(f"Database not found: {self.db_path}") from e
+        else:
+            conn = sqlite3.connect(str(self.db_path),
+                                   cached_statements=CACHED_STATEMENTS)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        # Per-connection tuning: in-memory temp b-trees (FTS and ORDER BY
+        # sorts), reads through a 256 MiB mmap window, ~20 MB page cache.
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.row_factory = sqlite3.Row
+        if not self.checkpoint_on_close and hasattr(sqlite3, "SQLITE_DBCONFIG_NO_CKPT_ON_CLOSE"):
+            conn.setconfig(sqlite3.SQLITE_DBCONFIG_NO_CKPT_ON_CLOSE, True)
+        return conn
+
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.execute("PRAGMA journal_mode=WAL")
-            self._conn.execute("PRAGMA foreign_keys=ON")
-            self._conn.row_factory = sqlite3.Row
+            self._conn = self._connect()
         if not self._migrated:
             self._migrate()
         return self._conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Commit the writes made inside the block together, or roll them back.
+
+        Store writes inside the block join it instead of committing one by
+        one, so a sequence of writes costs a single COMMIT. Blocks nest; only
+        the outermost one commits.
+        """
+        conn = self.conn
+        depth = self._tx_depth
+        self._tx_depth = depth + 1
+        try:
+            if depth:
+                yield conn
+            else:
+                with conn:
+                    yield conn
+        finally:
+            self._tx_depth = depth
+
     def close(self):
         if self._conn is not None:
             self._conn.close()
@@ -124,12 +188,19 @@ class EventStore:
     def initialize(self) -> None:
         """Create tables, indexes, and FTS5 triggers."""
         self.conn.executescript(SCHEMA_SQL)
+        # SCHEMA_SQL is the current schema: stamp it so the next open
+        # doesn't replay every migration (and rebuild the FTS index).
+        with self.transaction():
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
 
     def _migrate(self) -> None:
         """Run schema migrations if needed."""
         self._migrated = True
         # Check if meta table exists (may not for brand-new DBs before initialize)
-        tables = self._conn.execute(
+        tables = self.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='meta'"
         ).fetchone()
         if not tables:
@@ -142,16 +213,16 @@ class EventStore:
             # Add related_ids column if missing
             columns = {
                 row[1] for row in
-                self._conn.execute("PRAGMA table_info(events)").fetchall()
+                self.conn.execute("PRAGMA table_info(events)").fetchall()
             }
             if "related_ids" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN related_ids TEXT"
                 )
             self.set_meta("schema_version", "2")
 
         if version < 3:
-            self._conn.executescript("""
+            self.conn.executescript("""
                 CREATE TABLE IF NOT EXISTS conversations (
                     id            TEXT PRIMARY KEY,
                     topic         TEXT NOT NULL,
@@ -183,33 +254,33 @@ class EventStore:
             # Add event lifecycle and priority columns
             columns = {
                 row[1] for row in
-                self._conn.execute("PRAGMA table_info(events)").fetchall()
+                self.conn.execute("PRAGMA table_info(events)").fetchall()
             }
             if "status" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN status TEXT NOT NULL DEFAULT 'active'"
                 )
             if "priority" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN priority TEXT NOT NULL DEFAULT 'normal'"
                 )
             if "resolved_reason" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN resolved_reason TEXT"
                 )
             if "superseded_by_event_id" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN superseded_by_event_id TEXT"
                 )
             # Add index for status-based queries (briefing filters)
-            self._conn.execute(
+            self.conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_events_status ON events(status)"
             )
             self.set_meta("schema_version", "4")
 
         if version < 5:
             # Add sessions table
-            self._conn.executescript("""
+            self.conn.executescript("""
                 CREATE TABLE IF NOT EXISTS sessions (
                     id          TEXT PRIMARY KEY,
                     agent_id    TEXT NOT NULL,
@@ -227,10 +298,10 @@ class EventStore:
             # Add session_id column to events
             columns = {
                 row[1] for row in
-                self._conn.execute("PRAGMA table_info(events)").fetchall()
+                self.conn.execute("PRAGMA table_info(events)").fetchall()
             }
             if "session_id" not in columns:
-                self._conn.execute(
+                self.conn.execute(
                     "ALTER TABLE events ADD COLUMN session_id TEXT"
                 )
             self.set_meta("schema_version", "5")
@@ -238,12 +309,12 @@ class EventStore:
         if version < 6:
             columns = {
                 row[1] for row in
-                self._conn.execute("PRAGMA table_info(events)").fetchall()
+                self.conn.execute("PRAGMA table_info(events)").fetchall()
             }
             if "area" not in columns:
-                self._conn.execute("ALTER TABLE events ADD COLUMN area TEXT")
+                self.conn.execute("ALTER TABLE events ADD COLUMN area TEXT")
             # Rebuild the FTS index to include the area column.
-            self._conn.executescript("""
+            self.conn.executescript("""
                 DROP TRIGGER IF EXISTS events_ai;
                 DROP TABLE IF EXISTS events_fts;
                 CREATE VIRTUAL TABLE events_fts USING fts5(
@@ -261,19 +332,34 @@ class EventStore:
             project_dir = self.db_path.parent.parent
             rules = load_area_map(project_dir)
             if rules:
-                rows = self._conn.execute(
+                rows = self.conn.execute(
                     "SELECT id, scope FROM events WHERE area IS NULL"
                 ).fetchall()
                 for row in rows:
                     scope = json.loads(row["scope"]) if row["scope"] else None
                     area = infer_area(scope, rules)
                     if area:
-                        self._conn.execute(
+                        self.conn.execute(
                             "UPDATE events SET area = ? WHERE id = ?",
                             (area, row["id"]),
                         )
             self.set_meta("schema_version", "6")
 
+        if version < 7:
+            # Filter-then-sort indexes: "WHERE <column> = ? ORDER BY timestamp
+            # DESC LIMIT n" walks the index in order and stops after n rows,
+            # instead of sorting every match. They supersede the
+            # single-column indexes on the same columns.
+            self.conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(event_type, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_events_agent_ts ON events(agent_id, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_events_status_ts ON events(status, timestamp);
+                DROP INDEX IF EXISTS idx_events_type;
+                DROP INDEX IF EXISTS idx_events_agent;
+                DROP INDEX IF EXISTS idx_events_status;
+            """)
+            self.set_meta("schema_version", "7")
+
     @staticmethod
     def _generate_id() -> str:
         return f"evt-{uuid.uuid4().hex[:12]}"
@@ -318,7 +404,7 @@ class EventStore:
         return Event(
             id=row["id"],
             timestamp=row["timestamp"],
-            event_type=EventType(row["event_type"]),
+            event_type=EVENT_TYPE_BY_VALUE[row["event_type"]],
             agent_id=row["agent_id"],
             content=row["content"],
             scope=scope,
@@ -341,7 +427,7 @@ class EventStore:
         scope_json = json.dumps(event.scope) if event.scope else None
         related_json = json.dumps(event.related_ids) if event.related_ids else None
 
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "INSERT INTO events (id, timestamp, event_type, agent_id, content, scope, area, related_ids, status, priority, session_id) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -365,7 +451,7 @@ class EventStore:
                          e.agent_id, e.content, scope_json, e.area, related_json,
                          e.status, e.priority, e.session_id))
 
-        with self.conn:
+        with self.transaction():
             self.conn.executemany(
                 "INSERT INTO events (id, timestamp, event_type, agent_id, content, scope, area, related_ids, status, priority, session_id) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -373,23 +459,49 @@ class EventStore:
             )
         return len(rows)
 
+    def optimize(self) -> None:
+        """Merge FTS index segments, analyze and truncate the WAL after a bulk load.
+
+        Run once after a batch (e.g. seeding on init), never per insert:
+        optimize rewrites the whole full-text index and ANALYZE reads every
+        index.
+        """
+        with self.transaction():
+            self.conn.execute("INSERT INTO events_fts(events_fts) VALUES('optimize')")
+            # sqlite_stat1 row counts let the planner pick the more selective
+            # index when a query filters on several columns (type + agent).
+            self.conn.execute("ANALYZE")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _iter_events(self, sql: str, params) -> Iterator[Event]:
+        """Yield events row by row as the cursor produces them."""
+        for row in self.conn.execute(sql, params):
+            yield self._row_to_event(row)
+
     def query_fts(self, text: str, limit: int = 50) -> list[Event]:
         """Full-text search via FTS5 MATCH."""
+        return list(self.iter_fts(text, limit))
+
+    def iter_fts(self, text: str, limit: int = 50) -> Iterator[Event]:
+        """Full-text search via FTS5 MATCH, yielding events as they are read."""
         sql = (
             "SELECT e.* FROM events e "
             "JOIN events_fts ON events_fts.rowid = e.rowid "
             "WHERE events_fts MATCH ? "
             "ORDER BY e.timestamp DESC LIMIT ?"
         )
-        rows = self.conn.execute(sql, (text, limit)).fetchall()
-        return [self._row_to_event(r) for r in rows]
+        return self._iter_events(sql, (text, limit))
 
     def query_structured(self, filters: QueryFilter) -> list[Event]:
         """Query with optional FTS + structured filters."""
+        return list(self.iter_structured(filters))
+
+    def iter_structured(self, filters: QueryFilter) -> Iterator[Event]:
+        """Like query_structured, yielding events as they are read."""
         if filters.text and not filters.event_types and not filters.agent_id \
                 and not filters.scope and not filters.area and not filters.since \
                 and not filters.related_to:
-            return self.query_fts(filters.text, filters.limit)
+            return self.iter_fts(filters.text, filters.limit)
 
         conditions = []
         params: list = []
@@ -432,8 +544,7 @@ class EventStore:
         sql = f"SELECT e.* FROM events e WHERE {where} ORDER BY e.timestamp DESC LIMIT ?"
         params.append(filters.limit)
 
-        rows = self.conn.execute(sql, params).fetchall()
-        return [self._row_to_event(r) for r in rows]
+        return self._iter_events(sql, params)
 
     def recent_by_type(self, event_type: EventType, limit: int = 10,
                        since: str | None = None, scope: str | None = None,
@@ -461,6 +572,68 @@ class EventStore:
         rows = self.conn.execute(sql, params).fetchall()
         return [self._row_to_event(r) for r in rows]
 
+    def recent_by_types(self, limits: dict[EventType, int],
+                        since: str | None = None, scope: str | None = None,
+                        status: str | None = "active") -> dict[EventType, list[Event]]:
+        """Fetch the most recent events for several types in one query.
+
+        `limits` maps each type to its own row cap; equivalent to calling
+        recent_by_type once per type, without the per-call round trips.
+        """
+        if not limits:
+            return {}
+
+        types = list(limits)
+        conditions = ["event_type = ?"]
+        filters: list = []
+
+        if status:
+            conditions.append("status = ?")
+            filters.append(status)
+
+        if since:
+            conditions.append("timestamp >= ?")
+            filters.append(since)
+
+        if scope:
+            conditions.append("scope LIKE ?")
+            filters.append(f"%{scope}%")
+
+        # One recent_by_type lookup per type, glued with UNION ALL: each arm
+        # walks the (event_type, timestamp) index and stops at its own LIMIT.
+        where = " AND ".join(conditions)
+        arm = f"SELECT * FROM (SELECT * FROM events WHERE {where} ORDER BY timestamp DESC LIMIT ?)"
+        sql = " UNION ALL ".join(arm for _ in types)
+        params: list = []
+        for t in types:
+            params.extend((t.value, *filters, limits[t]))
+
+        result: dict[EventType, list[Event]] = {t: [] for t in types}
+        for row in self.conn.execute(sql, params):
+            event = self._row_to_event(row)
+            result[event.event_type].append(event)
+        return result
+
+    def briefing_stats(self, meta_key: str = "project_name") -> tuple[str | None, int, str | None]:
+        """(meta value, total event count, latest timestamp) in one query."""
+        row = self.conn.execute(
+            "SELECT (SELECT value FROM meta WHERE key = ?) AS meta_value, "
+            "(SELECT COUNT(*) FROM events) AS cnt, "
+            "(SELECT MAX(timestamp) FROM events) AS last_ts",
+            (meta_key,),
+        ).fetchone()
+        return row["meta_value"], row["cnt"], row["last_ts"]
+
+    def status_snapshot(self) -> tuple[int, str | None, str | None, str | None]:
+        """(event count, latest timestamp, project name, initialized_at) in one query."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS cnt, MAX(timestamp) AS last_ts, "
+            "(SELECT value FROM meta WHERE key = 'project_name') AS project_name, "
+            "(SELECT value FROM meta WHERE key = 'initialized_at') AS initialized_at "
+            "FROM events"
+        ).fetchone()
+        return row["cnt"], row["last_ts"], row["project_name"], row["initialized_at"]
+
     def recent_resolved(self, since: str, limit: int = 10) -> list[Event]:
         """Fetch recently resolved events within a time window."""
         sql = (
@@ -483,7 +656,7 @@ class EventStore:
         if not row:
             raise ValueError(f"Event not found: {event_id}")
 
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "UPDATE events SET status = ?, resolved_reason = ?, superseded_by_event_id = ? "
                 "WHERE id = ?",
@@ -502,8 +675,22 @@ class EventStore:
         ).fetchone()
         return self._row_to_event(row) if row else None
 
+    def get_events(self, event_ids: list[str]) -> dict[str, Event]:
+        """Fetch several events by ID in one query; missing IDs are absent."""
+        if not event_ids:
+            return {}
+        placeholders = ",".join("?" * len(event_ids))
+        rows = self.conn.execute(
+            f"SELECT * FROM events WHERE id IN ({placeholders})", event_ids
+        ).fetchall()
+        return {row["id"]: self._row_to_event(row) for row in rows}
+
     def query_related(self, event_id: str, limit: int = 50) -> list[Event]:
         """Find all events that reference the given event_id in their related_ids."""
+        return list(self.iter_related(event_id, limit))
+
+    def iter_related(self, event_id: str, limit: int = 50) -> Iterator[Event]:
+        """Like query_related, yielding events as they are read."""
         # Match exact ID in JSON array: "id" followed by ] or ,
         sql = (
             "SELECT * FROM events "
@@ -511,11 +698,7 @@ class EventStore:
             "ORDER BY timestamp DESC LIMIT ?"
         )
         # Match "id"] or "id",  — covers last element and non-last element
-        rows = self.conn.execute(
-            sql,
-            (f'%"{event_id}"]%', f'%"{event_id}",%', limit),
-        ).fetchall()
-        return [self._row_to_event(r) for r in rows]
+        return self._iter_events(sql, (f'%"{event_id}"]%', f'%"{event_id}",%', limit))
 
     def count(self) -> int:
         """Total event count."""
@@ -538,7 +721,7 @@ class EventStore:
 
     def set_meta(self, key: str, value: str) -> None:
         """Write to meta table (upsert)."""
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "INSERT INTO meta (key, value) VALUES (?, ?) "
                 "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
@@ -573,7 +756,7 @@ class EventStore:
 
         scope_json = json.dumps(session.scope) if session.scope else None
 
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "INSERT INTO sessions (id, agent_id, focus, scope, description, started_at, ended_at) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?)",
@@ -600,7 +783,7 @@ class EventStore:
             raise ValueError(f"Session {session_id} is already ended.")
 
         ended_at = ended_at or self._now_iso()
-        with self.conn:
+        with self.transaction():
             self.conn.execute(
                 "UPDATE sessions SET ended_at = ? WHERE id = ?",
                 (ended_at, session_id),
@@ -687,7 +870,7 @@ class EventStore:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=timeout_hours)
         cutoff_iso = cutoff.isoformat()
 
-        with self.conn:
+        with self.transaction():
             cursor = self.conn.execute(
                 "UPDATE sessions SET ended_at = ? "
                 "WHERE ended_at IS NULL AND started_at < ?",
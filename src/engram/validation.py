@@ -0,0 +1,26 @@
+"""Event content limits shared by the CLI, MCP server, hooks and bootstrap."""
+
+# Matches the CHECK(length(content) <= 2000) constraint on the events table:
+# both count characters (code points), not bytes.
+MAX_CONTENT_CHARS = 2000
+
+
+def validate_content(content: str) -> None:
+    """Reject content over the limit before any event is built or stored.
+
+    Raises:
+        ValueError: if content is longer than MAX_CONTENT_CHARS.
+    """
+    if len(content) > MAX_CONTENT_CHARS:
+        raise ValueError(
+            f"Content exceeds {MAX_CONTENT_CHARS} character limit "
+            f"({len(content)} chars). Summarize, or split into linked events "
+            f"(post the detail first, then reference its id as a related id)."
+        )
+
+
+def truncate_content(content: str, marker: str = "") -> str:
+    """Cap content at the limit, ending with `marker` when anything was cut."""
+    if len(content) <= MAX_CONTENT_CHARS:
+        return content
+    return content[:MAX_CONTENT_CHARS - len(marker)] + marker
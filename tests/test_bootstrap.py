@@ -111,3 +111,92 @@ class TestGitBootstrapper:
         # At least some commit events should have scope (file paths)
         with_scope = [e for e in commit_events if e.scope]
         assert len(with_scope) >= 1
+
+    def test_pygit2_walk_matches_git_log(self, git_repo):
+        pytest.importorskip("pygit2")
+        bootstrapper = GitBootstrapper(git_repo)
+        assert bootstrapper._repo is not None
+        walked = bootstrapper._parse_commits(10)
+
+        bootstrapper._repo = None  # force the git CLI path
+        logged = bootstrapper._parse_commits(10)
+
+        assert [(e.timestamp, e.event_type, e.content, e.scope) for e in walked] == \
+               [(e.timestamp, e.event_type, e.content, e.scope) for e in logged]
+
+    def test_rename_lists_old_and_new_paths(self, git_repo):
+        subprocess.run(["git", "mv", "src/main.py", "src/app.py"], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "Move main module"], cwd=git_repo, check=True)
+        bootstrapper = GitBootstrapper(git_repo)
+        bootstrapper._repo = None  # force the git CLI path
+        latest = bootstrapper._parse_commits(1)[0]
+        assert sorted(latest.scope) == ["src/app.py", "src/main.py"]
+
+    def test_git_log_stream_records_split_across_reads(self, git_repo, monkeypatch):
+        monkeypatch.setattr("engram.bootstrap.READ_CHUNK", 7)
+        bootstrapper = GitBootstrapper(git_repo)
+        bootstrapper._repo = None  # force the git CLI path
+        events = bootstrapper._parse_commits(10)
+        assert [e.content for e in events] == [
+            "Add README",
+            "Refactored: Refactor API handler for clarity",
+            "Fixed: Fix authentication bug in login flow",
+            "Initial commit with main module",
+        ]
+        assert events[0].scope == ["README.md"]
+
+    def test_mine_history_paths_filter(self, git_repo):
+        bootstrapper = GitBootstrapper(git_repo)
+        events = bootstrapper.mine_history(paths=["src/auth.py"])
+        commit_events = [e for e in events if e.scope != ["README.md"]]
+        assert [e.content for e in commit_events] == [
+            "Fixed: Fix authentication bug in login flow",
+        ]
+
+    def test_paths_filter_git_cli_matches_pygit2(self, git_repo):
+        pytest.importorskip("pygit2")
+        bootstrapper = GitBootstrapper(git_repo)
+        walked = bootstrapper._parse_commits(10, paths=["src"])
+
+        bootstrapper._repo = None  # force the git CLI path
+        logged = bootstrapper._parse_commits(10, paths=["src"])
+
+        assert [(e.content, e.scope) for e in walked] == \
+               [(e.content, e.scope) for e in logged]
+        assert len(logged) == 3
+
+    def test_fix_keyword_wins_over_earlier_refactor_keyword(self, git_repo):
+        bootstrapper = GitBootstrapper(git_repo)
+        event_type, content = bootstrapper._classify_commit(
+            "Refactor session loader to fix race", ["a.py"])
+        assert event_type == EventType.DISCOVERY
+        assert content.startswith("Fixed:")
+
+    def test_long_readme_excerpt_truncated(self, git_repo):
+        (git_repo / "README.md").write_text("# Big\n" + "é" * 50_000)
+        events = GitBootstrapper(git_repo)._extract_project_docs()
+        readme = next(e for e in events if e.scope == ["README.md"])
+        assert readme.content.endswith("... (truncated)")
+        assert len(readme.content) == len("Project README.md: ") + 1800 + len("... (truncated)")
+
+    def test_detect_project_name_pyproject(self, git_repo):
+        (git_repo / "pyproject.toml").write_text(
+            "[build-system]\nrequires = ['setuptools']\n\n[project]\nname = 'widgets'\n")
+        assert GitBootstrapper(git_repo).detect_project_name() == "widgets"
+
+    def test_detect_project_name_poetry(self, git_repo):
+        (git_repo / "pyproject.toml").write_text('[tool.poetry]\nname = "gadgets"\n')
+        assert GitBootstrapper(git_repo).detect_project_name() == "gadgets"
+
+    def test_origin_url_read_from_git_config(self, git_repo):
+        bootstrapper = GitBootstrapper(git_repo)
+        bootstrapper._repo = None  # exercise the no-pygit2 path
+        assert bootstrapper._config_origin_url() == ""
+
+        subprocess.run(["git", "remote", "add", "upstream", "https://example.com/a/other.git"],
+                       cwd=git_repo, check=True)
+        subprocess.run(["git", "remote", "add", "origin", "git@github.com:acme/my-tool.git"],
+                       cwd=git_repo, check=True)
+        assert bootstrapper._config_origin_url() == bootstrapper._run_git(
+            "remote", "get-url", "origin").strip()
+        assert bootstrapper.detect_project_name() == "my-tool"
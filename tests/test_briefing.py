@@ -392,3 +392,26 @@ def test_briefing_focus_matches_area(tmp_path):
         assert "email cooldown decision" in contents
     finally:
         store.close()
+
+
+def test_scope_relevance_matches_startswith_semantics():
+    def ev(*scope):
+        return Event(id="", timestamp="", event_type=EventType.WARNING,
+                     agent_id="a", content="x", scope=list(scope))
+
+    def reference(scope, focus):
+        for s in scope:
+            if s == focus:
+                return 3
+            if focus.startswith(s):
+                return 2
+            if s.startswith(focus):
+                return 1
+        return 0
+
+    focus = "src/engram"
+    scopes = [["src/engram"], ["src"], ["src/"], ["src/engram/cli.py"],
+              ["src/engramX"], ["sr"], ["lib/x"], [""], ["lib", "src/engram/a.py"]]
+    for scope in scopes:
+        got = BriefingGenerator._scope_relevance(ev(*scope), focus, len(focus))
+        assert got == reference(scope, focus), scope
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Tests for the Engram CLI."""
 
 import json
+import os
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -65,6 +66,14 @@ class TestInit:
         assert "engram briefing" in content
         assert "## Project Memory (Engram)" in content
 
+    def test_claude_md_marker_detection(self, tmp_path):
+        from engram.cli import _auto_write_claude_md
+        claude_md = tmp_path / "CLAUDE.md"
+        claude_md.write_text("")
+        assert _auto_write_claude_md(tmp_path).startswith("Appended")
+        assert _auto_write_claude_md(tmp_path) == "CLAUDE.md already has Engram section."
+        assert claude_md.read_text().count("## Project Memory (Engram)") == 1
+
 
 class TestPost:
 
@@ -180,6 +189,12 @@ class TestStatus:
         assert "total_events" in data
         assert "db_size_bytes" in data
 
+    def test_status_uninitialized(self, runner, tmp_path):
+        result = runner.invoke(cli, ["-p", str(tmp_path), "status"])
+        assert result.exit_code == 1
+        assert "Engram not initialized" in result.output
+        assert not (tmp_path / ".engram").exists()
+
 
 class TestGC:
 
@@ -238,6 +253,24 @@ class TestConsultCLI:
         assert "Started consultation:" in result.output
         assert "conv-" in result.output
 
+    def test_consult_start_writes_log_before_exit(self, runner, init_project):
+        result = runner.invoke(cli, [
+            "-p", str(init_project), "consult", "start",
+            "-t", "Test topic", "-m", "gpt-4o"
+        ])
+        assert result.exit_code == 0
+        assert list((init_project / "docs" / "consultations").glob("conv-*.md"))
+
+    def test_consult_start_reports_log_write_failure(self, runner, init_project):
+        (init_project / "docs").mkdir()
+        (init_project / "docs" / "consultations").write_text("not a directory")
+        result = runner.invoke(cli, [
+            "-p", str(init_project), "consult", "start",
+            "-t", "Test topic", "-m", "gpt-4o"
+        ])
+        assert result.exit_code != 0
+        assert isinstance(result.exception, OSError)
+
     def test_consult_start_unknown_model(self, runner, init_project):
         result = runner.invoke(cli, [
             "-p", str(init_project), "consult", "start",
@@ -365,3 +398,89 @@ class TestHookCommands:
         )
         assert result.exit_code == 0
         assert "Engram Briefing" in result.output
+
+    def test_main_routes_hooks_without_click(self, runner, git_project, monkeypatch, capsys):
+        import io
+        from engram import cli as cli_module
+        runner.invoke(cli, ["-p", str(git_project), "init"])
+        store = EventStore(git_project / ".engram" / "events.db")
+        store.insert(Event(id="", timestamp="", event_type=EventType.WARNING,
+                           agent_id="test", content="Fast path warning"))
+        store.close()
+
+        def no_click():
+            raise AssertionError("hook went through click")
+
+        payload = json.dumps({"session_id": "sess-fast", "cwd": str(git_project)})
+        monkeypatch.setattr(cli_module, "cli", no_click)
+        monkeypatch.setattr("sys.argv", ["engram", "hook", "session-start"])
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(payload.encode())))
+        cli_module.main()
+        assert "Fast path warning" in capsys.readouterr().out
+
+
+class TestStoreLifecycle:
+
+    @pytest.mark.parametrize("args", [
+        ["status"],
+        ["resolve", "evt-missing", "--reason", "gone"],  # exits with an error
+    ])
+    def test_store_closed_once_per_invocation(self, runner, git_project, monkeypatch, args):
+        runner.invoke(cli, ["-p", str(git_project), "init"])
+        closed = []
+        original = EventStore.close
+        monkeypatch.setattr(EventStore, "close",
+                            lambda self: (closed.append(self), original(self)))
+        runner.invoke(cli, ["-p", str(git_project), *args])
+        assert len(closed) == 1
+
+
+class TestResolveProject:
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX-only fast path")
+    def test_cwd_matches_resolved_path(self, tmp_path, monkeypatch):
+        from engram.cli import _resolve_project
+        real = tmp_path / "real"
+        real.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real)
+        monkeypatch.chdir(link)
+        assert _resolve_project(".") == Path(".").resolve() == real.resolve()
+
+    def test_relative_path_follows_chdir(self, tmp_path, monkeypatch):
+        from engram.cli import _resolve_project
+        for name in ("a", "b"):
+            (tmp_path / name / "proj").mkdir(parents=True)
+            monkeypatch.chdir(tmp_path / name)
+            assert _resolve_project("proj") == (tmp_path / name / "proj").resolve()
+
+
+class TestVersion:
+
+    def test_version_option(self, runner):
+        from engram import __version__
+        result = runner.invoke(cli, ["--version"])
+        assert result.exit_code == 0
+        assert result.output == f"engram, version {__version__}\n"
+
+    def test_main_answers_version_without_click(self, runner, monkeypatch, capsys):
+        from engram import cli as cli_module
+
+        def no_click():
+            raise AssertionError("--version went through click")
+
+        monkeypatch.setattr(cli_module, "cli", no_click)
+        monkeypatch.setattr("sys.argv", ["engram", "-V"])
+        cli_module.main()
+        # Same text click prints for the full parse
+        assert capsys.readouterr().out == runner.invoke(cli, ["-V"]).output
+
+
+def test_cli_import_is_lazy():
+    """Importing the CLI (as `engram --help` does) loads no engram submodules."""
+    import sys
+    code = ("import sys, engram.cli; "
+            "print(sorted(m for m in sys.modules if m.startswith('engram.')))")
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['engram.cli']"
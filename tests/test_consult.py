@@ -12,6 +12,7 @@ from engram.consult import (
     ConsultationEngine,
     read_file_for_consultation,
     format_file_message,
+    parse_models,
 )
 
 
@@ -28,6 +29,16 @@ def engine(tmp_path):
     store.close()
 
 
+class TestParseModels:
+
+    def test_strips_and_skips_empty(self):
+        assert parse_models(" gpt-4o, gemini-flash ,,") == ["gpt-4o", "gemini-flash"]
+
+    def test_returns_fresh_list(self):
+        parse_models("gpt-4o").append("mutated")
+        assert parse_models("gpt-4o") == ["gpt-4o"]
+
+
 class TestStart:
 
     def test_start_creates_conversation(self, engine):
@@ -98,7 +109,9 @@ class TestGetResponses:
 
     @patch("engram.consult.providers.send_message")
     def test_get_responses_multi_model(self, mock_send, engine):
-        mock_send.side_effect = ["GPT says yes", "Gemini says no"]
+        # Models are asked concurrently: answer by model, not by call order
+        answers = {"gpt-4o": "GPT says yes", "gemini-flash": "Gemini says no"}
+        mock_send.side_effect = lambda model_key, *args, **kwargs: answers[model_key]
         conv_id = engine.start("Test", ["gpt-4o", "gemini-flash"])
         engine.add_message(conv_id, "Should we?")
 
@@ -141,14 +154,31 @@ class TestGetResponses:
             engine.get_responses(conv_id)
 
 
+    @patch("engram.consult.providers.send_message")
+    def test_get_responses_asks_models_concurrently(self, mock_send, engine):
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def send(model_key, *args, **kwargs):
+            barrier.wait()  # both calls must be in flight at once
+            return f"{model_key} done"
+
+        mock_send.side_effect = send
+        conv_id = engine.start("Test", ["gpt-4o", "gemini-flash"])
+        engine.add_message(conv_id, "Go")
+        responses = engine.get_responses(conv_id)
+        assert [r["content"] for r in responses] == ["gpt-4o done", "gemini-flash done"]
+
+
 class TestMessageHistoryFormatting:
 
     @patch("engram.consult.providers.send_message")
     def test_multi_model_concatenation(self, mock_send, engine):
         """When multiple models respond, their responses should be concatenated
         with sender labels for the next API call."""
-        # First round
-        mock_send.side_effect = ["GPT response", "Gemini response", "GPT round 2"]
+        # First round (models are asked concurrently, so answer by model)
+        answers = {"gpt-4o": "GPT response", "gemini-flash": "Gemini response"}
+        mock_send.side_effect = lambda model_key, *args, **kwargs: answers[model_key]
         conv_id = engine.start("Test", ["gpt-4o", "gemini-flash"])
         engine.add_message(conv_id, "Initial question")
         engine.get_responses(conv_id)
@@ -172,6 +202,33 @@ class TestMessageHistoryFormatting:
         assert messages[2]["content"] == "Follow-up"
 
 
+    def test_history_grouping_edge_cases(self, engine):
+        conv_id = engine.start("Test", ["gpt-4o", "gemini-flash"])
+        rows = [
+            ("assistant", "gpt-4o", "stray reply"),
+            ("user", "host", "Q1"),
+            ("system", "host", "ignored"),
+            ("user", "host", "Q1 follow-up"),
+            ("assistant", "gpt-4o", "A"),
+            ("assistant", "gemini-flash", "B"),
+            ("assistant", "gpt-4o", "C"),
+            ("user", "host", "Q2"),
+        ]
+        with engine.store.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO conversation_messages (conv_id, role, sender, content, created_at) "
+                "VALUES (?, ?, ?, ?, '2026-01-01T00:00:00+00:00')",
+                [(conv_id, *row) for row in rows],
+            )
+        assert engine._build_api_messages(conv_id) == [
+            {"role": "assistant", "content": "[gpt-4o]: stray reply"},
+            {"role": "user", "content": "Q1"},
+            {"role": "user", "content": "Q1 follow-up"},
+            {"role": "assistant", "content": "[gpt-4o]: A\n\n[gemini-flash]: B\n\n[gpt-4o]: C"},
+            {"role": "user", "content": "Q2"},
+        ]
+
+
 class TestTokenTruncation:
 
     @patch("engram.consult.providers.send_message")
@@ -199,6 +256,23 @@ class TestTokenTruncation:
         assert messages[0]["content"].startswith("Message 0:")
         assert messages[-1]["content"] == "Final question"
 
+    def test_truncation_keeps_first_and_newest_that_fit(self, engine):
+        from engram.consult import MAX_INPUT_CHARS
+        size = MAX_INPUT_CHARS // 4
+        messages = [{"role": "user", "content": str(n) * size} for n in range(8)]
+        result = engine._truncate_if_needed(messages)
+        # first + the last three fill the budget exactly
+        assert result[0] is messages[0]
+        assert result[1]["content"] == "[...4 earlier messages truncated...]"
+        assert result[2:] == messages[5:]
+
+    def test_truncation_keeps_last_message_even_if_oversized(self, engine):
+        from engram.consult import MAX_INPUT_CHARS
+        messages = [{"role": "user", "content": "x" * MAX_INPUT_CHARS} for _ in range(3)]
+        result = engine._truncate_if_needed(messages)
+        assert result[1]["content"] == "[...1 earlier messages truncated...]"
+        assert result[2] is messages[2]
+
 
 class TestComplete:
 
@@ -264,17 +338,29 @@ class TestListConversations:
         result = engine.list_conversations()
         assert result[0]["message_count"] == 1
 
+    def test_list_message_counts_per_conversation(self, engine):
+        a = engine.start("A", ["gpt-4o"])
+        b = engine.start("B", ["gpt-4o"])
+        engine.start("Empty", ["gpt-4o"])
+        engine.add_message(a, "One")
+        engine.add_message(a, "Two")
+        engine.add_message(b, "Three")
+        counts = {c["topic"]: c["message_count"] for c in engine.list_conversations()}
+        assert counts == {"A": 2, "B": 1, "Empty": 0}
+
 
 class TestSaveLog:
 
     def test_log_file_created(self, engine, tmp_path):
         conv_id = engine.start("Test topic", ["gpt-4o"])
+        engine.flush_logs()
         log_path = tmp_path / "docs" / "consultations" / f"{conv_id}.md"
         assert log_path.exists()
 
     def test_log_contains_metadata(self, engine, tmp_path):
         conv_id = engine.start("Design review", ["gpt-4o", "gemini-flash"],
                                system_prompt="Be thorough")
+        engine.flush_logs()
         log_path = tmp_path / "docs" / "consultations" / f"{conv_id}.md"
         content = log_path.read_text()
 
@@ -292,6 +378,7 @@ class TestSaveLog:
         engine.add_message(conv_id, "My question")
         engine.get_responses(conv_id)
 
+        engine.flush_logs()
         log_path = tmp_path / "docs" / "consultations" / f"{conv_id}.md"
         content = log_path.read_text()
 
@@ -312,6 +399,7 @@ class TestSaveLog:
         engine.add_message(conv_id, "Question 2")
         engine.get_responses(conv_id)
 
+        engine.flush_logs()
         log_path = tmp_path / "docs" / "consultations" / f"{conv_id}.md"
         content = log_path.read_text()
 
@@ -324,11 +412,42 @@ class TestSaveLog:
         conv_id = engine.start("Test", ["gpt-4o"])
         engine.complete(conv_id, summary="Decided to use approach A")
 
+        engine.flush_logs()
         log_path = tmp_path / "docs" / "consultations" / f"{conv_id}.md"
         content = log_path.read_text()
         assert "## Summary" in content
         assert "Decided to use approach A" in content
 
+    def test_flush_logs_raises_failed_write(self, engine, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "consultations").write_text("not a directory")
+        engine.start("Test", ["gpt-4o"])
+        with pytest.raises(OSError):
+            engine.flush_logs()
+
+    @patch("engram.consult.providers.send_message")
+    def test_queued_writes_coalesce_to_latest(self, mock_send, engine, tmp_path):
+        import threading
+        from engram import consult
+
+        mock_send.return_value = "Response"
+        conv_id = engine.start("Test", ["gpt-4o"])
+        engine.flush_logs()
+        # Hold the writer so the next changes queue up behind it
+        release = threading.Event()
+        consult._log_writer.submit(release.wait, 5)
+        with patch("engram.consult._write_log", wraps=consult._write_log) as write:
+            engine.add_message(conv_id, "Question 1")
+            engine.get_responses(conv_id)
+            engine.complete(conv_id, summary="Done")
+            release.set()
+            engine.flush_logs()
+        assert write.call_count == 1
+
+        content = (tmp_path / "docs" / "consultations" / f"{conv_id}.md").read_text()
+        assert "Question 1" in content
+        assert "## Summary" in content
+
 
 class TestReadFileForConsultation:
 
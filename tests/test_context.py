@@ -85,6 +85,16 @@ class TestAssemble:
         result = assembler.assemble()
         assert len(result) <= MAX_CONTEXT_CHARS + 50  # small tolerance for truncation marker
 
+    def test_readme_excerpt_is_first_lines(self, assembler, tmp_path):
+        from engram.context import README_MAX_LINES
+        lines = [f"Line {i}" for i in range(README_MAX_LINES + 20)]
+        (tmp_path / "README.md").write_text("\n".join(lines) + "\n")
+        assert assembler._read_readme() == "\n".join(lines[:README_MAX_LINES])
+
+    def test_readme_excerpt_skips_undecodable_file(self, assembler, tmp_path):
+        (tmp_path / "README.md").write_bytes(b"\xff\xfe\x00bad")
+        assert assembler._read_readme() is None
+
     def test_source_modules_listed(self, assembler, tmp_path):
         src_dir = tmp_path / "src" / "engram"
         src_dir.mkdir(parents=True)
@@ -97,6 +107,14 @@ class TestAssemble:
         assert "store.py" in result
         assert "cli.py" in result
 
+    def test_source_modules_only_python_files(self, assembler, tmp_path):
+        src_dir = tmp_path / "src" / "engram"
+        (src_dir / "__pycache__").mkdir(parents=True)
+        (src_dir / "store.py").write_text("")
+        (src_dir / "cli.py").write_text("")
+        (src_dir / "notes.txt").write_text("")
+        assert assembler._list_source_modules() == "cli.py, store.py"
+
     def test_no_source_modules_when_dir_missing(self, assembler):
         result = assembler.assemble()
         assert "Source Modules" not in result
@@ -1,6 +1,7 @@
 """Tests for the shared init helper."""
 
 import subprocess
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -70,6 +71,10 @@ def test_perform_init_sets_project_name_and_initialized_at(tmp_path):
     store = EventStore(tmp_path / ".engram" / "events.db")
     try:
         assert store.get_meta("project_name") == tmp_path.name
-        assert store.get_meta("initialized_at") is not None
+        initialized_at = store.get_meta("initialized_at")
+        # Same format as event timestamps: microseconds and a UTC offset
+        parsed = datetime.fromisoformat(initialized_at)
+        assert parsed.utcoffset() == timedelta(0)
+        assert initialized_at == parsed.isoformat()
     finally:
         store.close()
@@ -0,0 +1,62 @@
+"""Tests for the engram._json helpers."""
+
+import importlib
+import io
+import json
+import sys
+from dataclasses import asdict
+
+import pytest
+
+from engram import _json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def test_write_pretty_text_stream():
+    out = io.StringIO()
+    _json.write_pretty({"a": [1, 2], "b": "x"}, out)
+    assert out.getvalue().endswith("}\n")
+    assert json.loads(out.getvalue()) == {"a": [1, 2], "b": "x"}
+
+
+def test_write_pretty_keeps_order_with_binary_buffer():
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="utf-8")
+    out.write("before\n")
+    _json.write_pretty({"é": 1}, out)
+    out.write("after\n")
+    out.flush()
+    before, *body, after = raw.getvalue().decode("utf-8").splitlines()
+    assert (before, after) == ("before", "after")
+    assert json.loads("\n".join(body)) == {"é": 1}
+
+
+def test_loads_accepts_bytes_and_str():
+    assert _json.loads(b'{"cwd": "/x"}') == _json.loads('{"cwd": "/x"}') == {"cwd": "/x"}
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """engram._json as loaded without orjson installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)  # import raises ImportError
+    module = importlib.reload(_json)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(_json)
+
+
+def test_dataclasses_serialize_alike_on_both_backends(stdlib_json, seeded_store):
+    from engram.briefing import BriefingGenerator
+    briefing = BriefingGenerator(seeded_store).generate()
+    events = briefing.other_active
+    text = stdlib_json.dumps_pretty(events)
+    assert '"event_type": "' in text
+    assert json.loads(text) == json.loads(json.dumps([asdict(e) for e in events]))
+    if orjson is not None:
+        assert orjson.loads(text) == orjson.loads(orjson.dumps(briefing.other_active))
+        assert (json.loads(stdlib_json.dumps_pretty(briefing))
+                == orjson.loads(orjson.dumps(briefing)))
@@ -332,6 +332,13 @@ class TestMCPConsultation:
         assert "conv-" in result
         assert "Test topic" in result
 
+    def test_start_consultation_reports_log_write_failure(self, mcp_project):
+        from engram.mcp_server import start_consultation
+        (mcp_project / "docs").mkdir()
+        (mcp_project / "docs" / "consultations").write_text("not a directory")
+        with pytest.raises(OSError):
+            start_consultation(topic="Test topic", models="gpt-4o")
+
     @patch("engram.consult.providers.send_message", return_value="Model says hello")
     def test_start_consultation_with_message(self, mock_send, mcp_project):
         from engram.mcp_server import start_consultation
@@ -268,3 +268,45 @@ class TestV2ToV3Migration:
         assert store2.count() == 1
         assert store2.get_meta("schema_version") == str(SCHEMA_VERSION)
         store2.close()
+
+
+def _index_names(store: EventStore) -> set[str]:
+    return {r["name"] for r in store.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='events'")}
+
+
+class TestV7Indexes:
+
+    def test_v1_db_gets_composite_indexes(self, tmp_path):
+        db_path = tmp_path / "events.db"
+        create_v1_db(db_path)
+        store = EventStore(db_path)
+        try:
+            names = _index_names(store)
+            assert {"idx_events_type_ts", "idx_events_agent_ts",
+                    "idx_events_status_ts"} <= names
+            assert not names & {"idx_events_type", "idx_events_agent", "idx_events_status"}
+        finally:
+            store.close()
+
+    def test_type_query_reads_index_in_order(self, tmp_path):
+        store = EventStore(tmp_path / "events.db")
+        store.initialize()
+        try:
+            plan = " ".join(r[3] for r in store.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM events WHERE event_type = ? "
+                "ORDER BY timestamp DESC LIMIT 50", ("warning",)))
+            assert "idx_events_type_ts" in plan
+            assert "TEMP B-TREE" not in plan
+        finally:
+            store.close()
+
+    def test_new_db_is_stamped_current(self, tmp_path):
+        store = EventStore(tmp_path / "events.db")
+        store.initialize()
+        store.close()
+        store = EventStore(tmp_path / "events.db")
+        try:
+            assert store.get_meta("schema_version") == str(SCHEMA_VERSION)
+        finally:
+            store.close()
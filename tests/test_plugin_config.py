@@ -20,3 +20,21 @@ def test_mcp_json_has_no_unexpanded_shell_vars():
     server = cfg["mcpServers"]["engram"]
     # No ENGRAM_PROJECT_DIR default — the server resolves cwd itself.
     assert "ENGRAM_PROJECT_DIR" not in server.get("env", {})
+
+
+def test_hook_commands_are_declared_console_scripts():
+    """Plugin and `engram hooks install` must call scripts pyproject installs."""
+    import tomllib
+    from engram.hooks import HOOK_CONFIG
+
+    pyproject = tomllib.loads((PLUGIN_DIR.parent / "pyproject.toml").read_text())
+    scripts = pyproject["project"]["scripts"]
+
+    def commands(cfg):
+        return {h["command"] for entries in cfg["hooks"].values()
+                for entry in entries for h in entry["hooks"]}
+
+    plugin_cfg = json.loads((PLUGIN_DIR / "hooks" / "hooks.json").read_text())
+    assert commands(plugin_cfg) == commands(HOOK_CONFIG)
+    for command in commands(HOOK_CONFIG):
+        assert command in scripts, f"{command} is not a console script"
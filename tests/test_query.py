@@ -8,8 +8,11 @@ from engram.query import QueryEngine, parse_since, parse_event_types
 from engram.formatting import (
     format_compact, format_json, format_event_compact,
     format_briefing_compact, format_briefing_json,
+    write_compact, write_json,
+    format_conversation_lines, format_conversations_lines,
+    format_session_compact,
 )
-from engram.models import BriefingResult
+from engram.models import BriefingResult, Session
 
 
 class TestParseSince:
@@ -159,6 +162,21 @@ class TestFormatting:
         assert len(data) == 3
         assert "event_type" in data[0]
 
+    def test_streamed_output_matches_buffered(self, seeded_store):
+        import io
+        from engram.models import QueryFilter
+        for events in ([], seeded_store.query_structured(QueryFilter(limit=3))):
+            for write, fmt in ((write_json, format_json), (write_compact, format_compact)):
+                out = io.StringIO()
+                write(iter(events), out)
+                assert out.getvalue() == fmt(events) + "\n"
+
+    def test_execute_iter_is_lazy(self, seeded_store):
+        engine = QueryEngine(seeded_store)
+        results = engine.execute_iter(event_types=[EventType.WARNING])
+        assert not isinstance(results, list)
+        assert [e.event_type for e in results] == [EventType.WARNING] * 2
+
     def test_format_briefing_compact(self, seeded_store):
         warnings = seeded_store.recent_by_type(EventType.WARNING)
         decisions = seeded_store.recent_by_type(EventType.DECISION)
@@ -219,3 +237,42 @@ class TestFormatting:
         result = format_briefing_json(briefing)
         data = json.loads(result)
         assert data["project_name"] == "test-project"
+
+    def test_conversation_lines(self):
+        conv = {
+            "id": "conv-1", "topic": "Caching", "status": "active",
+            "models": ["gpt-4o", "claude"], "system_prompt": None,
+            "messages": [
+                {"sender": "user", "role": "user", "content": "Should we cache?"},
+                {"sender": "gpt-4o", "role": "assistant", "content": "Yes.\nWith a TTL."},
+            ],
+            "summary": "Cache with TTL",
+        }
+        assert "".join(format_conversation_lines(conv)) == (
+            "# Caching [active]\n"
+            "ID: conv-1 | Models: gpt-4o, claude\n"
+            "\n"
+            "[user] (user):\nShould we cache?\n\n"
+            "[gpt-4o] (assistant):\nYes.\nWith a TTL.\n\n"
+            "Summary: Cache with TTL\n"
+        )
+
+    def test_conversations_lines(self):
+        convs = [{"id": "conv-1", "status": "paused", "topic": "Caching",
+                  "message_count": 3, "models": ["gpt-4o"]}]
+        assert list(format_conversations_lines(convs)) == [
+            "conv-1 [paused] Caching (3 msgs, gpt-4o)\n"]
+        assert list(format_conversations_lines([])) == ["(no consultations)\n"]
+
+    def test_session_relative_time_uses_given_now(self):
+        now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+        session = Session(id="sess-1", agent_id="claude-code", focus="auth",
+                          started_at="2026-03-01T09:30:00Z")
+        assert "started 2h ago" in format_session_compact(session, now)
+        session.started_at = "2026-02-27T12:00:00+00:00"
+        assert "started 2d ago" in format_session_compact(session, now)
+
+    def test_session_unparseable_start_shown_raw(self):
+        session = Session(id="sess-1", agent_id="claude-code", focus="auth",
+                          started_at="yesterday-ish, roughly")
+        assert "started yesterday-ish, r" in format_session_compact(session)
@@ -34,6 +34,49 @@ class TestEventStore:
         assert count == 10
         assert store.count() == 10
 
+    def test_transaction_commits_writes_together(self, store):
+        event = Event(id="", timestamp="", event_type=EventType.DISCOVERY,
+                      agent_id="test", content="Grouped")
+        with store.transaction():
+            store.insert(event)
+            store.set_meta("project_name", "grouped")
+            assert store.conn.in_transaction  # inner writes did not commit
+        assert not store.conn.in_transaction
+        assert store.get_meta("project_name") == "grouped"
+
+    def test_transaction_rolls_back_on_error(self, store):
+        try:
+            with store.transaction():
+                store.set_meta("project_name", "doomed")
+                with store.transaction():
+                    store.insert(Event(id="", timestamp="", event_type=EventType.DISCOVERY,
+                                       agent_id="test", content="Doomed"))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        assert store.get_meta("project_name") is None
+        assert store.count() == 0
+
+    def test_get_events_by_ids(self, seeded_store):
+        ids = [e.id for e in seeded_store.query_structured(QueryFilter(limit=2))]
+        found = seeded_store.get_events([*ids, "evt-missing"])
+        assert set(found) == set(ids)
+        assert all(found[i].id == i for i in ids)
+        assert seeded_store.get_events([]) == {}
+
+    def test_optimize_keeps_fts_searchable(self, seeded_store):
+        seeded_store.optimize()
+        results = seeded_store.query_fts("JWT refresh")
+        assert any("JWT" in e.content for e in results)
+        wal = seeded_store.db_path.with_name(seeded_store.db_path.name + "-wal")
+        assert not wal.exists() or wal.stat().st_size == 0
+
+    def test_optimize_gathers_planner_stats(self, seeded_store):
+        seeded_store.optimize()
+        indexes = {r["idx"] for r in seeded_store.conn.execute(
+            "SELECT idx FROM sqlite_stat1 WHERE tbl = 'events'")}
+        assert {"idx_events_type_ts", "idx_events_agent_ts"} <= indexes
+
     def test_query_fts(self, seeded_store):
         results = seeded_store.query_fts("JWT refresh")
         assert len(results) >= 1
@@ -94,6 +137,37 @@ class TestEventStore:
         assert len(results) == 1
         assert "JWT" in results[0].content
 
+    def test_recent_by_types_matches_per_type_queries(self, seeded_store):
+        limits = {EventType.MUTATION: 1, EventType.DISCOVERY: 5, EventType.OUTCOME: 5}
+        results = seeded_store.recent_by_types(limits, scope="src/")
+        for event_type, limit in limits.items():
+            expected = seeded_store.recent_by_type(event_type, limit=limit, scope="src/")
+            assert [e.id for e in results[event_type]] == [e.id for e in expected]
+        assert len(results[EventType.MUTATION]) == 1
+
+    def test_recent_by_types_keeps_per_type_order_for_tied_timestamps(self, store):
+        from tests.conftest import ts_offset
+        ts = ts_offset(0)
+        store.insert_batch([
+            Event(id="", timestamp=ts, event_type=event_type, agent_id="a", content=f"c{i}")
+            for i, event_type in enumerate([EventType.WARNING, EventType.DECISION] * 4)
+        ])
+        limits = {EventType.WARNING: 3, EventType.DECISION: 2}
+        results = store.recent_by_types(limits)
+        for event_type, limit in limits.items():
+            expected = store.recent_by_type(event_type, limit=limit)
+            assert [e.id for e in results[event_type]] == [e.id for e in expected]
+
+    def test_briefing_stats(self, seeded_store):
+        seeded_store.set_meta("project_name", "demo")
+        name, total, last = seeded_store.briefing_stats()
+        assert (name, total, last) == ("demo", 8, seeded_store.last_activity())
+
+    def test_status_snapshot(self, seeded_store):
+        seeded_store.set_meta("project_name", "demo")
+        assert seeded_store.status_snapshot() == (
+            8, seeded_store.last_activity(), "demo", None)
+
     def test_count(self, seeded_store):
         assert seeded_store.count() == 8
 
@@ -264,7 +338,7 @@ def test_migration_v5_to_v6_backfills_area(tmp_path):
 
     store2 = EventStore(db)
     try:
-        assert store2.get_meta("schema_version") == "6"
+        assert store2.get_meta("schema_version") == "7"
         rows = store2.recent_by_type(EventType.DECISION)
         assert rows[0].area == "billing"
         assert rows[0].scope == ["src/billing/pay.py"]
@@ -292,7 +366,53 @@ def test_migration_v6_no_map_leaves_area_null(tmp_path):
 
     store2 = EventStore(db)
     try:
-        assert store2.get_meta("schema_version") == "6"
+        assert store2.get_meta("schema_version") == "7"
         assert store2.recent_by_type(EventType.DECISION)[0].area is None
     finally:
         store2.close()
+
+
+def test_must_exist_does_not_create_database(tmp_path):
+    import pytest
+    from engram.store import EventStore
+
+    db = tmp_path / "events.db"
+    store = EventStore(db, must_exist=True)
+    with pytest.raises(FileNotFoundError):
+        store.conn
+    assert not db.exists()
+
+
+def test_must_exist_keeps_open_error_for_existing_path(tmp_path):
+    import sqlite3
+    import pytest
+    from engram.store import EventStore
+
+    db = tmp_path / "events.db"
+    db.mkdir()  # exists, but can't be opened as a database
+    store = EventStore(db, must_exist=True)
+    with pytest.raises(sqlite3.OperationalError):
+        store.conn
+
+
+def test_no_checkpoint_on_close_keeps_wal(tmp_path):
+    import sqlite3
+    import pytest
+    from engram.store import EventStore
+    from engram.models import Event, EventType
+
+    if not hasattr(sqlite3, "SQLITE_DBCONFIG_NO_CKPT_ON_CLOSE"):
+        pytest.skip("needs Python 3.12+ sqlite3.Connection.setconfig")
+    db = tmp_path / "events.db"
+    setup = EventStore(db)
+    setup.initialize()
+    setup.close()
+    store = EventStore(db, checkpoint_on_close=False)
+    store.insert(Event(id="", timestamp="", event_type=EventType.MUTATION,
+                       agent_id="test", content="appended"))
+    store.close()
+    wal = tmp_path / "events.db-wal"
+    assert wal.exists() and wal.stat().st_size > 0
+    reopened = EventStore(db)
+    assert reopened.count() == 1
+    reopened.close()
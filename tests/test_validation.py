@@ -0,0 +1,28 @@
+"""Tests for the shared event content limits."""
+
+import pytest
+
+from engram.validation import MAX_CONTENT_CHARS, truncate_content, validate_content
+
+
+def test_validate_content_accepts_limit():
+    validate_content("x" * MAX_CONTENT_CHARS)
+
+
+def test_validate_content_rejects_over_limit():
+    with pytest.raises(ValueError, match="character limit"):
+        validate_content("x" * (MAX_CONTENT_CHARS + 1))
+
+
+def test_validate_content_counts_characters_not_bytes():
+    validate_content("é" * MAX_CONTENT_CHARS)
+
+
+def test_truncate_content_with_marker():
+    capped = truncate_content("x" * 5000, "\n[truncated]")
+    assert len(capped) == MAX_CONTENT_CHARS
+    assert capped.endswith("\n[truncated]")
+
+
+def test_truncate_content_leaves_short_content():
+    assert truncate_content("short", "\n[truncated]") == "short"